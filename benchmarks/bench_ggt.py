@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Laufzeiten der ggT-Verfahren ueber die Bitlaenge der Operanden.
+
+Verglichen werden die in Python geschriebenen Verfahren mit
+math.gcd, das auch ggt_auto() verwendet. Die Messung zeigt, ab
+welcher Bitlaenge ggt_lehmer() schneller als ggt() ist; math.gcd
+ist fuer alle Bitlaengen am schnellsten.
+
+Aufruf aus dem Wurzelverzeichnis:
+
+    python -m benchmarks.bench_ggt
+"""
+
+import math
+import random
+import time
+
+from kap4 import ggt, ggt_binaer, ggt_lehmer
+
+verfahren = [ggt, ggt_binaer, ggt_lehmer, math.gcd]
+bitlaengen = [64, 256, 1024, 4096, 16384, 65536, 100000]
+
+
+def messen(f, paare):
+    """Liefert die mittlere Laufzeit von f ueber alle Paare."""
+    t = time.perf_counter()
+    for a, b in paare:
+        f(a, b)
+    return (time.perf_counter() - t) / len(paare)
+
+
+def main(wiederholungen=5):
+    namen = [f.__name__ for f in verfahren]
+    print(' {:>6} | '.format('Bits') +
+          ' | '.join('{:>11}'.format(n) for n in namen))
+    for bits in bitlaengen:
+        paare = [(random.getrandbits(bits), random.getrandbits(bits))
+                 for _ in range(wiederholungen)]
+        zeiten = [messen(f, paare) for f in verfahren]
+        print(' {:>6} | '.format(bits) +
+              ' | '.join('{:>11.3e}'.format(t) for t in zeiten))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Harmonische Zahlen H_n mit sofortigem und verzoegertem Kuerzen
+von RationaleZahl im Vergleich zu fractions.Fraction und zur
+Summation im Binaerbaum mit rational_sum().
+
+Aufruf aus dem Wurzelverzeichnis:
+
+    python -m benchmarks.bench_rational [n]
+"""
+
+import sys
+import time
+from fractions import Fraction
+
+from kap4 import RationaleZahl, rational_sum
+
+grenzen = [1 << 10, 1 << 12, 1 << 14, 1 << 16]
+
+
+def harmonisch(n, eins):
+    """Berechnet H_n = 1 + 1/2 + ... + 1/n durch fortlaufendes
+    Addieren, wobei eins die Eins des verwendeten Datentyps ist."""
+    s = eins - eins
+    for k in range(1, n + 1):
+        s = s + eins / k
+    return s
+
+
+def harmonisch_verzoegert(n, bits):
+    """Berechnet H_n mit verzoegertem Kuerzen ab dem gegebenen
+    Zuwachs der Bitlaenge und kuerzt das Ergebnis abschliessend."""
+    with RationaleZahl.verzoegert(bits):
+        s = harmonisch(n, RationaleZahl(1))
+    s.kuerzen()
+    return s
+
+
+def harmonisch_baum(n):
+    """Berechnet H_n mit rational_sum()."""
+    return rational_sum(Fraction(1, k) for k in range(1, n + 1))
+
+
+def messen(f, *args):
+    """Liefert Ergebnis und Laufzeit von f(*args)."""
+    t = time.perf_counter()
+    ergebnis = f(*args)
+    return ergebnis, time.perf_counter() - t
+
+
+def main(n_max=10**5):
+    print(' {:>7} | {:>9} | {:>9} | '.format('n', 'Fraction', 'sofort') +
+          ' | '.join('{:>9}'.format('ab ' + str(g)) for g in grenzen) +
+          ' | {:>9}'.format('Baum'))
+    n = 1000
+    while n <= n_max:
+        f, t_f = messen(harmonisch, n, Fraction(1))
+        q, t_q = messen(harmonisch, n, RationaleZahl(1))
+        assert q == f
+        zeiten = []
+        for g in grenzen:
+            q, t = messen(harmonisch_verzoegert, n, g)
+            assert q == f
+            zeiten.append(t)
+        q, t = messen(harmonisch_baum, n)
+        assert q == f
+        zeiten.append(t)
+        print(' {:>7} | {:>9.3f} | {:>9.3f} | '.format(n, t_f, t_q) +
+              ' | '.join('{:>9.3f}'.format(t) for t in zeiten))
+        n *= 10
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Skalierung des parallelen Siebs ueber die Anzahl Prozesse.
+
+Aufruf aus dem Wurzelverzeichnis:
+
+    python -m benchmarks.bench_sieb [hi]
+"""
+
+import os
+import sys
+import time
+
+from kap3 import erat_parallel
+
+
+def messen(hi, prozesse, wiederholungen=3):
+    """Liefert die beste Laufzeit von erat_parallel() im
+    Zaehlmodus fuer [0, hi) mit gegebener Prozessanzahl."""
+    beste = float('inf')
+    for _ in range(wiederholungen):
+        t = time.perf_counter()
+        erat_parallel(0, hi, prozesse, zaehlen=True)
+        beste = min(beste, time.perf_counter() - t)
+    return beste
+
+
+def main(hi=10**8):
+    anzahl = [1]
+    while anzahl[-1] * 2 <= (os.cpu_count() or 1):
+        anzahl.append(anzahl[-1] * 2)
+    print('pi({}) = {}'.format(hi, erat_parallel(0, hi, zaehlen=True)))
+    print(' Prozesse |  Zeit [s] | Speedup | Effizienz')
+    t1 = None
+    for p in anzahl:
+        t = messen(hi, p)
+        t1 = t1 or t
+        print(' {:>8} | {:>9.3f} | {:>7.2f} | {:>9.2f}'.format(
+            p, t, t1 / t, t1 / t / p))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
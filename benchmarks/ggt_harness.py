@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Vergleich der ggT-Verfahren auf erzeugten unguenstigen Eingaben.
+
+Fuer jedes Verfahren und jeden Fall werden die Anzahl der Schritte
+(ueber tools.intermediate_values, sofern das Verfahren diese
+protokolliert), die Laufzeit und der mit tracemalloc gemessene
+Spitzenspeicher erfasst und als JSON ausgegeben.
+
+Aufruf aus dem Wurzelverzeichnis:
+
+    python -m benchmarks.ggt_harness [ausgabe.json]
+
+Weitere Verfahren werden durch Ergaenzen der Liste 'verfahren'
+aufgenommen.
+"""
+
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+import tools
+from kap4 import (ggt, ggt_wechselwegnahme, ggt_rueckwaerts,
+                  ggt_vorwaerts, ggt_binaer, ggt_lehmer, ggt_hgcd,
+                  ggt_auto)
+
+# Paare (Name, Funktion); Verfahren ohne Protokollierung
+# liefern als Schrittanzahl None
+verfahren = [
+    ('ggt', ggt),
+    ('ggt_wechselwegnahme', ggt_wechselwegnahme),
+    ('ggt_rueckwaerts', ggt_rueckwaerts),
+    ('ggt_vorwaerts', ggt_vorwaerts),
+    ('ggt_binaer', ggt_binaer),
+    ('ggt_lehmer', ggt_lehmer),
+    ('ggt_hgcd', ggt_hgcd),
+    ('ggt_auto', ggt_auto),
+    ('math.gcd', math.gcd),
+]
+
+bitlaengen = [64, 256, 1024, 4096, 16384]
+
+# Obergrenze fuer die Anzahl Subtraktionen der Wechselwegnahme;
+# Faelle darueber werden uebersprungen
+max_subtraktionen = 10**6
+
+
+def fibonacci_paar(bits):
+    """Liefert aufeinanderfolgende Fibonacci-Zahlen mit etwa der
+    gegebenen Bitlaenge, den unguenstigsten Fall des Euklid'schen
+    Algorithmus."""
+    a, b = 1, 1
+    while a.bit_length() < bits:
+        a, b = a + b, a
+    return a, b
+
+
+def schiefes_paar(bits):
+    """Liefert eine grosse und eine kleine Zahl, den unguenstigsten
+    Fall der Wechselwegnahme."""
+    return random.getrandbits(bits) | (1 << (bits - 1)), \
+        random.randrange(1, 256)
+
+
+def zufalls_paar(bits):
+    """Liefert zwei zufaellige Zahlen der gegebenen Bitlaenge."""
+    return random.getrandbits(bits) | (1 << (bits - 1)), \
+        random.getrandbits(bits) | (1 << (bits - 1))
+
+
+faelle = [
+    ('fibonacci', fibonacci_paar),
+    ('schief', schiefes_paar),
+    ('zufall', zufalls_paar),
+]
+
+
+def subtraktionen(a, b):
+    """Anzahl der Subtraktionen von ggt_wechselwegnahme(a, b), also
+    die Summe der Teilquotienten des Euklid'schen Algorithmus."""
+    s = 0
+    while b != 0:
+        q, r = divmod(a, b)
+        s, a, b = s + q, b, r
+    return s
+
+
+def schritte(f, a, b):
+    """Liefert die Anzahl der von f protokollierten Schritte oder
+    None, falls f keine Zwischenwerte protokolliert."""
+    tools.is_intermediate_values, alt = True, tools.is_intermediate_values
+    tools.intermediate_values = None
+    try:
+        f(a, b)
+    finally:
+        tools.is_intermediate_values = alt
+    if tools.intermediate_values is None:
+        return None
+    return len(tools.intermediate_values) - 1
+
+
+def laufzeit(f, a, b, mindestdauer=0.05):
+    """Liefert die mittlere Laufzeit eines Aufrufs von f(a, b),
+    wobei mindestens mindestdauer Sekunden gemessen wird."""
+    n, gesamt = 0, 0.
+    while gesamt < mindestdauer:
+        t = time.perf_counter()
+        f(a, b)
+        gesamt += time.perf_counter() - t
+        n += 1
+    return gesamt / n
+
+
+def speicher(f, a, b):
+    """Liefert den Spitzenspeicher in Bytes, den f(a, b) ueber
+    den vor dem Aufruf belegten Speicher hinaus anfordert."""
+    tracemalloc.start()
+    try:
+        basis = tracemalloc.get_traced_memory()[0]
+        f(a, b)
+        spitze = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return spitze - basis
+
+
+def messen(bitlaengen=bitlaengen, faelle=faelle, verfahren=verfahren):
+    """Misst alle Verfahren auf allen Faellen.
+
+    :param bitlaengen: Liste der Bitlaengen der Eingaben.
+    :param faelle: Liste von Paaren (Name, Erzeuger).
+    :param verfahren: Liste von Paaren (Name, Funktion).
+    :return: Liste von dicts mit den Schluesseln 'verfahren', 'fall',
+             'bits', 'schritte', 'zeit' und 'speicher'.
+    """
+    ergebnisse = []
+    for fall, erzeuger in faelle:
+        for bits in bitlaengen:
+            a, b = erzeuger(bits)
+            zu_teuer = subtraktionen(a, b) > max_subtraktionen
+            for name, f in verfahren:
+                eintrag = {'verfahren': name, 'fall': fall, 'bits': bits,
+                           'schritte': None, 'zeit': None,
+                           'speicher': None}
+                if not (zu_teuer and f is ggt_wechselwegnahme):
+                    eintrag['schritte'] = schritte(f, a, b)
+                    eintrag['zeit'] = laufzeit(f, a, b)
+                    eintrag['speicher'] = speicher(f, a, b)
+                ergebnisse.append(eintrag)
+    return ergebnisse
+
+
+def main(pfad=None):
+    ergebnisse = messen()
+    if pfad is None:
+        json.dump(ergebnisse, sys.stdout, indent=1)
+        print()
+    else:
+        with open(pfad, 'w') as datei:
+            json.dump(ergebnisse, datei, indent=1)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -26,4 +26,19 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from .binom import nchoosek, pascal  # noqa: F401
+from .binom import nchoosek_prim, nchoosek_mod  # noqa: F401
+from .binom import pascal_zeilen, pascal_zeile, pascal_diagonale  # noqa: F401
+from .binom import pascal_mod2, pascal_mod2_statistik  # noqa: F401
+from .binom import pascal_mod2_bild  # noqa: F401
+from .binom import FakultaetsCache, nchoosek_many  # noqa: F401
+from .primtest import miller_rabin, is_prime, is_prime_many  # noqa: F401
 from .prim import erat, probediv, fermat_probediv, fermat  # noqa: F401
+from .sieb import erat_basis, erat_segment, erat_parallel  # noqa: F401
+from .sieb import PrimzahlTabelle, primzahltabelle  # noqa: F401
+from .sieb import spf_sieb, SPFTabelle  # noqa: F401
+from .faktorisierung import pollard_rho, pollard_p_minus_1  # noqa: F401
+from .faktorisierung import faktorisierung  # noqa: F401
+from .primzahlfunktionen import prime_pi, nth_prime  # noqa: F401
+from .multiplikativ import multiplikativ_sieb, eulerphi_sieb  # noqa: F401
+from .multiplikativ import teileranzahl_sieb, teilersumme_sieb  # noqa: F401
+from .multiplikativ import moebius_sieb, arithmetische_funktionen  # noqa: F401
@@ -25,15 +25,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from array import array
 
-def nchoosek(n, k):
+from .faktorisierung import faktorisierung
+from .primtest import is_prime
+from .sieb import primzahltabelle
+
+
+def nchoosek(n, k, cache=None):
     """Berechnet den Binomialkoeffizienten "n ueber k",
     definiert als n! / (k! * (n-k)!).
 
     :param n: Positive Ganzzahl.
     :param k: Positive Ganzzahl.
-    :return: Binomialkoeffizient.
+    :param cache: FakultaetsCache, aus dem die Fakultaeten
+        entnommen werden (optional).
+    :return: Binomialkoeffizient (ggf. modulo der Primzahl
+             des Caches).
     """
+    if cache is not None:
+        return cache.nchoosek(n, k)
     k = min(k, n - k)
     denominator = 1
     for i in range(1, k + 1):
@@ -58,5 +69,473 @@ def pascal(N):
         zeile = (n + 1) * [1]
         for k in range(1, n):
             zeile[k] = (dreieck[n - 1])[k - 1] + (dreieck[n - 1])[k]
-        dreieck = dreieck + [zeile]
+        dreieck.append(zeile)
     return dreieck
+
+
+def pascal_zeilen(N, m=None):
+    """Liefert nacheinander die Zeilen 0, ..., N des Pascalschen
+    Dreiecks, wobei Eintrag [k] der n-ten Zeile dem
+    Binomialkoeffizienten "n ueber k" (ggf. modulo m) entspricht.
+
+    Alle Zeilen werden in demselben Puffer berechnet, der
+    von Zeile zu Zeile um einen Eintrag waechst und von rechts
+    nach links ueberschrieben wird. Die gelieferte Zeile wird
+    daher im naechsten Schritt veraendert und muss bei Bedarf
+    kopiert werden.
+
+    :param N: Index der letzten Zeile.
+    :param m: Modul (optional), 1 <= m < 2^63. Falls angegeben,
+        werden die Zeilen als array('Q') modulo m berechnet.
+    :return: Generator ueber die Zeilen.
+    """
+    zeile = [1] if m is None else array('Q', [1 % m])
+    if N >= 0:
+        yield zeile
+    for n in range(1, N + 1):
+        zeile.append(zeile[0])
+        if m is None:
+            for k in range(n - 1, 0, -1):
+                zeile[k] += zeile[k - 1]
+        else:
+            for k in range(n - 1, 0, -1):
+                zeile[k] = (zeile[k] + zeile[k - 1]) % m
+        yield zeile
+
+
+def _pascal_zeile_mod(n, m):
+    """Berechnet die n-te Zeile des Pascalschen Dreiecks modulo m
+    mit "n ueber k+1" = "n ueber k" * (n - k) / (k + 1).
+
+    Die Primfaktoren von m werden aus Zaehler und Nenner
+    herausgezogen und als Exponenten mitgefuehrt, sodass nur
+    durch zu m teilerfremde Zahlen dividiert werden muss.
+    """
+    primfaktoren = sorted(set(faktorisierung(m)))
+    exponenten = len(primfaktoren) * [0]
+    zeile = array('Q', [0]) * (n + 1)
+    einheit = 1 % m
+    for k in range(n + 1):
+        c = einheit
+        for p, e in zip(primfaktoren, exponenten):
+            if e:
+                c = c * pow(p, e, m) % m
+        zeile[k] = c
+        zaehler, nenner = n - k, k + 1
+        for i, p in enumerate(primfaktoren):
+            while zaehler and zaehler % p == 0:
+                zaehler //= p
+                exponenten[i] += 1
+            while nenner % p == 0:
+                nenner //= p
+                exponenten[i] -= 1
+        einheit = einheit * zaehler % m * pow(nenner, -1, m) % m
+    return zeile
+
+
+def pascal_zeile(n, m=None, cache=None):
+    """Berechnet die n-te Zeile des Pascalschen Dreiecks
+    (ggf. modulo m) in O(n) Schritten, ohne die vorherigen
+    Zeilen zu berechnen.
+
+    :param n: Zeilenindex, n >= 0.
+    :param m: Modul (optional), siehe pascal_zeilen().
+    :param cache: FakultaetsCache (optional). Falls angegeben,
+        wird jeder Eintrag aus den Fakultaeten des Caches
+        berechnet und m ignoriert.
+    :return: Liste bzw. array mit "n ueber k" fuer 0 <= k <= n.
+    """
+    if n < 0:
+        raise ValueError("n < 0")
+    if cache is not None:
+        zeile = [cache.nchoosek(n, k) for k in range(n + 1)]
+        return zeile if cache.p is None else array('Q', zeile)
+    if m is None:
+        zeile = [1]
+        for k in range(n):
+            zeile.append(zeile[-1] * (n - k) // (k + 1))
+        return zeile
+    return _pascal_zeile_mod(n, m)
+
+
+def pascal_diagonale(N, k, m=None):
+    """Liefert nacheinander die Binomialkoeffizienten
+    "n ueber k" fuer festes k und n = k, ..., N, also die
+    k-te Diagonale des Pascalschen Dreiecks (ggf. modulo m).
+
+    Ohne Modul wird "n+1 ueber k" = "n ueber k" * (n+1) / (n+1-k)
+    verwendet, mit Modul werden nur die ersten k + 1 Eintraege
+    jeder Zeile in einem Puffer mitgefuehrt.
+
+    :param N: Maximalwert fuer n.
+    :param k: Index der Diagonale, k >= 0.
+    :param m: Modul (optional), siehe pascal_zeilen().
+    :return: Generator ueber die Binomialkoeffizienten.
+    """
+    if m is None:
+        c = 1
+        for n in range(k, N + 1):
+            yield c
+            c = c * (n + 1) // (n + 1 - k)
+        return
+    zeile = array('Q', [1 % m]) + array('Q', [0]) * k
+    if k == 0 and N >= 0:
+        yield zeile[0]
+    for n in range(1, N + 1):
+        paare = zip(zeile[1:k + 1], zeile[:k])
+        zeile[1:k + 1] = array('Q', [(a + b) % m for a, b in paare])
+        if n >= k:
+            yield zeile[k]
+
+
+def produkt(faktoren):
+    """Multipliziert eine Folge von Zahlen paarweise in einem
+    balancierten Baum auf, sodass grosse Zahlen moeglichst
+    selten mit kleinen multipliziert werden.
+
+    :param faktoren: Iterierbare Folge von Zahlen.
+    :return: Produkt aller Zahlen (1 fuer eine leere Folge).
+    """
+    faktoren = list(faktoren)
+    while len(faktoren) > 1:
+        rest = [faktoren[-1]] if len(faktoren) % 2 else []
+        faktoren = [faktoren[i] * faktoren[i + 1]
+                    for i in range(0, len(faktoren) - 1, 2)] + rest
+    return faktoren[0] if faktoren else 1
+
+
+def _legendre(n, p):
+    """Liefert den Exponenten von p in n! (Formel von Legendre)."""
+    e, q = 0, p
+    while q <= n:
+        e += n // q
+        q *= p
+    return e
+
+
+def nchoosek_prim(n, k):
+    """Berechnet den Binomialkoeffizienten "n ueber k" aus
+    seiner Primfaktorzerlegung.
+
+    Der Exponent jeder Primzahl p <= n ergibt sich nach
+    Legendre als Summe ueber i von
+    n // p^i - k // p^i - (n - k) // p^i,
+    die Primzahlpotenzen werden mittels produkt() in einem
+    balancierten Baum multipliziert.
+
+    :param n: Positive Ganzzahl.
+    :param k: Positive Ganzzahl.
+    :return: Binomialkoeffizient.
+    """
+    k = min(k, n - k)
+    if k <= 0:
+        return 1
+    faktoren = []
+    for p in primzahltabelle.bis(n):
+        if p > n - k:
+            # Jede Primzahl in (n - k, n] teilt genau einmal
+            faktoren.append(p)
+            continue
+        e, q = 0, p
+        while q <= n:
+            e += n // q - k // q - (n - k) // q
+            q *= p
+        if e:
+            faktoren.append(p**e)
+    return produkt(faktoren)
+
+
+# Bis zu diesem Modul werden die Fakultaeten ohne p tabelliert
+_tabellen_grenze = 1 << 22
+
+# Zuletzt verwendete Tabellen, zusammen hoechstens so viele Bytes
+# wie eine Tabelle fuer den groessten tabellierten Modul
+_tabellen = {}
+_tabellen_max_bytes = 8 * _tabellen_grenze
+
+
+def _fakultaeten_ohne_p(p, q):
+    """Tabelle der Produkte aller i <= x mit p teilt nicht i,
+    modulo q = p^e, fuer 0 <= x < q.
+
+    Die Tabellen werden zwischengespeichert. Uebersteigt ihr
+    Speicherbedarf _tabellen_max_bytes, werden die am laengsten
+    nicht verwendeten verworfen.
+    """
+    tabelle = _tabellen.pop((p, q), None)
+    if tabelle is None:
+        tabelle = array('Q', [1]) * q
+        for i in range(2, q):
+            tabelle[i] = tabelle[i - 1] * (i if i % p else 1) % q
+    groesse = tabelle.itemsize * len(tabelle)
+    belegt = sum(t.itemsize * len(t) for t in _tabellen.values())
+    while _tabellen and belegt + groesse > _tabellen_max_bytes:
+        alt = _tabellen.pop(next(iter(_tabellen)))
+        belegt -= alt.itemsize * len(alt)
+    _tabellen[p, q] = tabelle
+    return tabelle
+
+
+def _fakultaet_ohne_p(n, p, q):
+    """Liefert n! / p^(Exponent von p in n!) modulo q = p^e.
+
+    Das Produkt aller zu p teilerfremden Zahlen eines vollen
+    Blocks der Laenge q ist nach dem verallgemeinerten Satz
+    von Wilson -1 modulo q (bzw. 1 fuer p = 2, q >= 8).
+    """
+    block = 1 if p == 2 and q >= 8 else q - 1
+    tabelle = _fakultaeten_ohne_p(p, q) if q <= _tabellen_grenze else None
+    r = 1
+    while n > 0:
+        if tabelle is not None:
+            rest = tabelle[n % q]
+        else:
+            rest = 1
+            for i in range(2, n % q + 1):
+                if i % p:
+                    rest = rest * i % q
+        r = r * pow(block, n // q, q) * rest % q
+        n //= p
+    return r
+
+
+def _nchoosek_mod_primzahl(n, k, p):
+    """Binomialkoeffizient modulo einer Primzahl p mit dem
+    Satz von Lucas."""
+    r = 1
+    while k > 0:
+        ni, ki = n % p, k % p
+        if ki > ni:
+            return 0
+        ki = min(ki, ni - ki)
+        zaehler = nenner = 1
+        for i in range(ki):
+            zaehler = zaehler * (ni - i) % p
+            nenner = nenner * (i + 1) % p
+        r = r * zaehler * pow(nenner, -1, p) % p
+        n, k = n // p, k // p
+    return r
+
+
+def _nchoosek_mod_primpotenz(n, k, p, e):
+    """Binomialkoeffizient modulo p^e nach Granvilles
+    Verallgemeinerung des Satzes von Lucas."""
+    if e == 1:
+        return _nchoosek_mod_primzahl(n, k, p)
+    q = p**e
+    v = _legendre(n, p) - _legendre(k, p) - _legendre(n - k, p)
+    if v >= e:
+        return 0
+    nenner = _fakultaet_ohne_p(k, p, q) * _fakultaet_ohne_p(n - k, p, q)
+    return (p**v * _fakultaet_ohne_p(n, p, q) * pow(nenner, -1, q)) % q
+
+
+def nchoosek_mod(n, k, m):
+    """Berechnet den Binomialkoeffizienten "n ueber k"
+    modulo m, ohne ihn vollstaendig auszurechnen.
+
+    Fuer Primzahlen wird der Satz von Lucas, fuer Primzahl-
+    potenzen dessen Verallgemeinerung nach Granville
+    verwendet. Fuer zusammengesetzte m werden die Ergebnisse
+    fuer die Primzahlpotenzen von m mit dem Chinesischen
+    Restsatz kombiniert.
+
+    :param n: Positive Ganzzahl.
+    :param k: Positive Ganzzahl.
+    :param m: Modul, m >= 1.
+    :return: "n ueber k" modulo m.
+    """
+    k = min(k, n - k)
+    if k <= 0:
+        return 1 % m
+    faktoren = faktorisierung(m)
+    r, M = 0, 1
+    for p in sorted(set(faktoren)):
+        e = faktoren.count(p)
+        q = p**e
+        x = _nchoosek_mod_primpotenz(n, k, p, e)
+        # r = x mod q und r mod M bleibt erhalten
+        r += M * ((x - r) * pow(M, -1, q) % q)
+        M *= q
+    return r
+
+
+class FakultaetsCache:
+    """Bei Bedarf wachsende Tabelle von Fakultaeten, exakt
+    oder modulo einer Primzahl p, aus der Binomial-
+    koeffizienten berechnet werden koennen.
+
+    Exakt werden nur die Fakultaeten an jeder schritt-ten
+    Stelle gespeichert. Uebersteigt deren Speicherbedarf
+    max_bytes, wird jede zweite Stuetzstelle verworfen und
+    der Abstand verdoppelt.
+
+    Modulo p werden Fakultaeten und inverse Fakultaeten fuer
+    alle n < min(p, max_bytes / 16) in zwei arrays gehalten,
+    fuer groessere n wird der Satz von Lucas verwendet.
+    """
+
+    def __init__(self, p=None, max_bytes=1 << 26):
+        """Erstellt einen leeren Cache.
+
+        :param p: Primzahl fuer modulare Berechnung (optional).
+        :param max_bytes: Obergrenze fuer den Speicherbedarf.
+        """
+        if p is not None and not is_prime(p):
+            raise ValueError("p ist keine Primzahl")
+        self.p = p
+        self.max_bytes = max_bytes
+        if p is None:
+            self.schritt = 1
+            self._stuetz = [1]
+            self._bytes = 0
+        else:
+            self._grenze = max(min(p, max_bytes // 16), 1)
+            self._fak = array('Q', [1])
+            self._inv = array('Q', [1])
+
+    def fakultaet(self, n):
+        """Liefert n! (ggf. modulo p, dann fuer n < p)."""
+        if self.p is not None:
+            if n >= self.p:
+                return 0
+            if n >= self._grenze:
+                # Ab der letzten Tabellenstelle modulo p weitermultiplizieren
+                p, f = self.p, self._fak[-1]
+                for i in range(len(self._fak), n + 1):
+                    f = f * i % p
+                return f
+            self._erweitern(n)
+            return self._fak[n]
+        while len(self._stuetz) <= n // self.schritt:
+            s, j = self.schritt, len(self._stuetz)
+            f = self._stuetz[-1] * produkt(range((j - 1) * s + 1, j * s + 1))
+            self._stuetz.append(f)
+            self._bytes += (f.bit_length() + 7) // 8
+            if self._bytes > self.max_bytes:
+                self._ausduennen()
+        s = self.schritt
+        i = n // s
+        return self._stuetz[i] * produkt(range(i * s + 1, n + 1))
+
+    def _ausduennen(self):
+        """Verwirft jede zweite Stuetzstelle."""
+        self._stuetz = self._stuetz[::2]
+        self.schritt *= 2
+        self._bytes = sum((f.bit_length() + 7) // 8 for f in self._stuetz)
+
+    def _erweitern(self, n):
+        """Erweitert die modularen Tabellen bis mindestens n."""
+        alt = len(self._fak)
+        if n < alt:
+            return
+        neu = min(max(n + 1, 2 * alt), self._grenze)
+        p, fak, inv = self.p, self._fak, self._inv
+        fak.extend(array('Q', [0]) * (neu - alt))
+        inv.extend(array('Q', [0]) * (neu - alt))
+        for i in range(alt, neu):
+            fak[i] = fak[i - 1] * i % p
+        inv[neu - 1] = pow(fak[neu - 1], -1, p)
+        for i in range(neu - 1, alt, -1):
+            inv[i - 1] = inv[i] * i % p
+
+    def _nchoosek_klein(self, n, k):
+        """"n ueber k" modulo p fuer 0 <= k <= n < p."""
+        if n >= self._grenze:
+            return _nchoosek_mod_primzahl(n, k, self.p)
+        self._erweitern(n)
+        p = self.p
+        return self._fak[n] * self._inv[k] % p * self._inv[n - k] % p
+
+    def nchoosek(self, n, k):
+        """Berechnet "n ueber k" (ggf. modulo p) aus den
+        Fakultaeten des Caches, siehe nchoosek()."""
+        k = min(k, n - k)
+        if self.p is None:
+            if k <= 0:
+                return 1
+            return self.fakultaet(n) // (self.fakultaet(k) *
+                                         self.fakultaet(n - k))
+        p, r = self.p, 1 % self.p
+        if k <= 0:
+            return r
+        while k > 0:
+            ni, ki = n % p, k % p
+            if ki > ni:
+                return 0
+            r = r * self._nchoosek_klein(ni, ki) % p
+            n, k = n // p, k // p
+        return r
+
+
+def nchoosek_many(paare, cache=None):
+    """Berechnet die Binomialkoeffizienten "n ueber k" fuer
+    eine Folge von Paaren (n, k).
+
+    Die Anfragen werden nach n sortiert abgearbeitet, sodass
+    der Cache nur einmal bis zum groessten n erweitert wird.
+
+    :param paare: Iterierbare Folge von Paaren (n, k).
+    :param cache: FakultaetsCache (Standard: neuer exakter Cache).
+    :return: Liste der Binomialkoeffizienten in der
+             Reihenfolge der Anfragen.
+    """
+    if cache is None:
+        cache = FakultaetsCache()
+    paare = list(paare)
+    ergebnis = len(paare) * [None]
+    for i in sorted(range(len(paare)), key=lambda i: paare[i][0]):
+        ergebnis[i] = cache.nchoosek(*paare[i])
+    return ergebnis
+
+
+def pascal_mod2(N):
+    """Liefert nacheinander die Zeilen 0, ..., N des Pascalschen
+    Dreiecks modulo 2 als Ganzzahlen, deren k-tes Bit
+    "n ueber k" modulo 2 entspricht.
+
+    Eine Zeile ergibt sich aus der vorherigen als
+    zeile_{n+1} = zeile_n XOR (zeile_n << 1),
+    sodass alle Eintraege einer Zeile gleichzeitig berechnet
+    werden.
+
+    :param N: Index der letzten Zeile.
+    :return: Generator ueber die Zeilen als Ganzzahlen.
+    """
+    zeile = 1
+    for _ in range(N + 1):
+        yield zeile
+        zeile ^= zeile << 1
+
+
+def pascal_mod2_statistik(N):
+    """Zaehlt fuer jede Zeile n = 0, ..., N die ungeraden
+    Binomialkoeffizienten "n ueber k".
+
+    Nach dem Satz von Glaisher ist diese Anzahl 2^s, wobei
+    s die Anzahl der Einsen in der Binaerdarstellung von n ist.
+
+    :param N: Index der letzten Zeile.
+    :return: Liste mit den Anzahlen je Zeile.
+    """
+    return [bin(zeile).count('1') for zeile in pascal_mod2(N)]
+
+
+def pascal_mod2_bild(N):
+    """Erzeugt ein Schwarzweissbild des Pascalschen Dreiecks
+    modulo 2 (Sierpinski-Dreieck) mit N + 1 Zeilen und Spalten
+    im Format PBM (P4), in dem ungerade Eintraege schwarz sind.
+
+    Da die Zeilen symmetrisch sind, entspricht das hoechste
+    Bit einer Zeile ihrem ersten Eintrag, und jede Zeile kann
+    ohne Umordnen der Bits gepackt werden.
+
+    :param N: Index der letzten Zeile.
+    :return: Bilddaten als bytes.
+    """
+    breite = N + 1
+    nbytes = (breite + 7) // 8
+    daten = [b'P4\n%d %d\n' % (breite, breite)]
+    for n, zeile in enumerate(pascal_mod2(N)):
+        daten.append((zeile << (8 * nbytes - n - 1)).to_bytes(nbytes, 'big'))
+    return b''.join(daten)
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+
+from .primtest import is_prime
+from .sieb import primzahltabelle
+
+
+def pollard_rho(n, c=1, x0=2, m=128):
+    """Sucht einen Teiler einer zusammengesetzten Zahl n mittels
+    Pollards Rho-Methode mit Brents Zyklenerkennung.
+
+    Iteriert wird x -> x^2 + c mod n. Statt fuer jeden Schritt
+    einen ggT zu berechnen, werden jeweils m Differenzen
+    modulo n aufmultipliziert und gemeinsam getestet.
+
+    :param n: Ungerade zusammengesetzte Zahl.
+    :param c: Konstante der Iterationsvorschrift.
+    :param x0: Startwert.
+    :param m: Anzahl Schritte je ggT.
+    :return: Teiler 1 < d <= n von n, wobei d == n bedeutet,
+             dass mit diesem c kein Teiler gefunden wurde.
+    """
+    y, r, q, g = x0, 1, 1, 1
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += m
+        r *= 2
+    if g == n:
+        # Letzten Block einzeln wiederholen
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+    return g
+
+
+def pollard_p_minus_1(n, B=10000):
+    """Sucht einen Teiler von n mittels Pollards (p-1)-Methode.
+
+    Erfolgreich ist das Verfahren, wenn n einen Primfaktor p
+    besitzt, fuer den p - 1 nur Primzahlpotenzen <= B enthaelt.
+
+    :param n: Ungerade zusammengesetzte Zahl.
+    :param B: Glattheitsschranke.
+    :return: Teiler 1 <= d <= n von n, wobei d == 1 oder d == n
+             bedeutet, dass kein Teiler gefunden wurde.
+    """
+    a = 2
+    for p in primzahltabelle.bis(B):
+        pk = p
+        while pk * p <= B:
+            pk *= p
+        a = pow(a, pk, n)
+    return math.gcd(a - 1, n)
+
+
+def _teiler(n, p_minus_1):
+    """Liefert einen echten Teiler einer zusammengesetzten
+    Zahl n ohne kleine Primfaktoren."""
+    w = math.isqrt(n)
+    if w * w == n:
+        return w
+    if p_minus_1:
+        d = pollard_p_minus_1(n)
+        if 1 < d < n:
+            return d
+    c = 1
+    while True:
+        d = pollard_rho(n, c)
+        if d != n:
+            return d
+        c += 1
+
+
+def faktorisierung(n, p_minus_1=True, grenze=1000):
+    """Ermittelt die Primfaktorzerlegung einer Zahl n.
+
+    Nach Probedivision durch alle Primzahlen bis zur Grenze
+    werden die verbleibenden Faktoren mittels Miller-Rabin
+    auf Primalitaet getestet und zusammengesetzte Faktoren mit
+    Pollards (p-1)- und Rho-Methode weiter zerlegt.
+
+    :param n: Zahl, deren Primfaktorzerlegung gesucht ist.
+    :param p_minus_1: Falls True, wird vor der Rho-Methode die
+        (p-1)-Methode versucht.
+    :param grenze: Schranke fuer die Probedivision.
+    :return: Sortierte Liste (ggf. mit Mehrfacheintraegen)
+             aller Primfaktoren.
+    """
+    factors = []
+    for p in primzahltabelle.bis(grenze):
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n = n // p
+    offen = [n] if n > 1 else []
+    while offen:
+        m = offen.pop()
+        if is_prime(m):
+            factors.append(m)
+        else:
+            d = _teiler(m, p_minus_1)
+            offen += [d, m // d]
+    return sorted(factors)
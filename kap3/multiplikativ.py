@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from array import array
+
+from .sieb import spf_sieb
+
+
+def _multiplikativ(N, f_pks, typen):
+    """Berechnet mehrere multiplikative Funktionen fuer alle
+    0 <= n <= N in einem gemeinsamen Durchlauf.
+
+    Ist p der kleinste Primfaktor von n und p^k die hoechste
+    Potenz von p, die n teilt, so gilt f(n) = f(n / p^k) * f(p^k).
+    Die Potenzen p^k werden aus dem Eintrag fuer n / p
+    fortgeschrieben, sodass f_pk nur fuer Primzahlpotenzen
+    ausgewertet werden muss.
+    """
+    spf = spf_sieb(N)
+    potenz = array(spf.typecode, bytes(spf.itemsize * (N + 1)))
+    exponent = array('B', bytes(N + 1))
+    werte = [array(typ, [0]) * (N + 1) for typ in typen]
+    if N >= 1:
+        for f in werte:
+            f[1] = 1
+    paare = list(zip(werte, f_pks))
+    for n in range(2, N + 1):
+        p = spf[n]
+        m = n // p
+        if spf[m] == p:
+            q, k = potenz[m] * p, exponent[m] + 1
+        else:
+            q, k = p, 1
+        potenz[n], exponent[n] = q, k
+        if q == n:
+            for f, f_pk in paare:
+                f[n] = f_pk(p, k)
+        else:
+            rest = n // q
+            for f, _ in paare:
+                f[n] = f[rest] * f[q]
+    return werte
+
+
+def multiplikativ_sieb(N, f_pk, typecode='q'):
+    """Berechnet eine multiplikative Funktion f fuer alle
+    0 <= n <= N, wobei f(1) = 1 und f(0) = 0 gesetzt wird.
+
+    :param N: Obere Schranke.
+    :param f_pk: Funktion (p, k) -> f(p^k) fuer Primzahlen p
+        und Exponenten k >= 1.
+    :param typecode: Typ der Eintraege des Ergebnisfelds.
+    :return: array mit den Werten f(0), ..., f(N).
+    """
+    return _multiplikativ(N, [f_pk], [typecode])[0]
+
+
+def _phi_pk(p, k):
+    """phi(p^k) = p^(k-1) * (p - 1)"""
+    return p**(k - 1) * (p - 1)
+
+
+def _tau_pk(p, k):
+    """tau(p^k) = k + 1"""
+    return k + 1
+
+
+def _sigma_pk(p, k):
+    """sigma(p^k) = (p^(k+1) - 1) / (p - 1)"""
+    return (p**(k + 1) - 1) // (p - 1)
+
+
+def _mu_pk(p, k):
+    """mu(p) = -1, mu(p^k) = 0 fuer k > 1"""
+    return -1 if k == 1 else 0
+
+
+def eulerphi_sieb(N):
+    """Berechnet die Eulersche Phi-Funktion fuer alle n <= N.
+
+    :param N: Obere Schranke.
+    :return: array mit phi(0), ..., phi(N).
+    """
+    return multiplikativ_sieb(N, _phi_pk)
+
+
+def teileranzahl_sieb(N):
+    """Berechnet die Anzahl der Teiler tau(n) fuer alle n <= N.
+
+    :param N: Obere Schranke.
+    :return: array mit tau(0), ..., tau(N).
+    """
+    return multiplikativ_sieb(N, _tau_pk)
+
+
+def teilersumme_sieb(N):
+    """Berechnet die Summe der Teiler sigma(n) fuer alle n <= N.
+
+    :param N: Obere Schranke.
+    :return: array mit sigma(0), ..., sigma(N).
+    """
+    return multiplikativ_sieb(N, _sigma_pk)
+
+
+def moebius_sieb(N):
+    """Berechnet die Moebius-Funktion mu(n) fuer alle n <= N.
+
+    :param N: Obere Schranke.
+    :return: array mit mu(0), ..., mu(N).
+    """
+    return multiplikativ_sieb(N, _mu_pk, 'b')
+
+
+def arithmetische_funktionen(N):
+    """Berechnet phi, tau, sigma und mu fuer alle n <= N in
+    einem gemeinsamen Durchlauf.
+
+    :param N: Obere Schranke.
+    :return: Tupel (phi, tau, sigma, mu) von arrays.
+    """
+    return tuple(_multiplikativ(N, [_phi_pk, _tau_pk, _sigma_pk, _mu_pk],
+                                ['q', 'q', 'q', 'b']))
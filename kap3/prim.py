@@ -27,6 +27,9 @@
 
 import math
 
+from .primtest import is_prime
+from .sieb import primzahltabelle
+
 
 def erat(N):
     """Ermittelt alle Primzahlen kleiner oder gleich N
@@ -51,7 +54,7 @@ def probediv(n):
     :return: Sortierte Liste (ggf. mit Mehrfacheintraegen)
              aller Primfaktoren.
     """
-    primes = erat(math.ceil(math.sqrt(n)))
+    primes = primzahltabelle.bis(math.isqrt(n - 1) + 1 if n > 0 else 0)
     factors = []
     for p in primes:
         while n % p == 0:
@@ -62,46 +65,116 @@ def probediv(n):
     return sorted(factors)
 
 
-def fermat_probediv(n):
+# Tabellen der Quadratreste: _quadratreste[M][r] == 1 genau
+# dann, wenn r ein Quadrat modulo M ist
+_quadratreste = {M: bytes(int(r in {i * i % M for i in range(M)})
+                          for r in range(M))
+                 for M in (16, 9, 5, 7, 11, 13)}
+
+# Modul, ueber dessen Restklassen im Siebmodus die Kandidaten
+# fuer x vorab bestimmt werden, sowie die danach noch
+# einzeln geprueften Moduln
+_sieb_modul = 16 * 9 * 5 * 7
+_sieb_filter = (11, 13)
+
+# Ab dieser Groesse wird standardmaessig der Siebmodus verwendet
+_sieb_grenze = 2**32
+
+
+def _ist_quadrat(r, moduln=(16, 9, 5, 7, 11, 13)):
+    """Prueft, ob r >= 0 eine Quadratzahl ist, und liefert
+    ggf. deren Wurzel, ansonsten None.
+
+    Nichtquadrate werden meist schon durch Quadratreste
+    modulo kleiner Zahlen erkannt, bevor die ganzzahlige
+    Wurzel berechnet werden muss.
+    """
+    for M in moduln:
+        if not _quadratreste[M][r % M]:
+            return None
+    y = math.isqrt(r)
+    return y if y * y == r else None
+
+
+def _fermat_suche(n):
+    """Sucht fuer eine ungerade Zahl n die kleinste Zahl
+    x >= sqrt(n), fuer die x^2 - n = y^2 eine Quadratzahl ist,
+    und liefert die Zerlegung n = (x + y) * (x - y).
+    """
+    q16 = _quadratreste[16]
+    x = math.isqrt(n - 1) + 1
+    r = x * x - n
+    while True:
+        if q16[r % 16]:
+            y = _ist_quadrat(r)
+            if y is not None:
+                return x + y, x - y
+        r, x = r + 2 * x + 1, x + 1
+
+
+def _fermat_sieb(n):
+    """Wie _fermat_suche(), jedoch werden vorab alle
+    Restklassen von x modulo _sieb_modul bestimmt, fuer die
+    x^2 - n ein Quadratrest ist, und nur diese durchlaufen.
+    """
+    L = _sieb_modul
+    x0 = math.isqrt(n - 1) + 1
+    moduln = [M for M in _quadratreste if L % M == 0]
+    schritte = [d for d in range(L)
+                if all(_quadratreste[M][((x0 + d) ** 2 - n) % M]
+                       for M in moduln)]
+    x = x0
+    while True:
+        for d in schritte:
+            y = _ist_quadrat((x + d) ** 2 - n, _sieb_filter)
+            if y is not None:
+                return x + d + y, x + d - y
+        x += L
+
+
+def fermat_probediv(n, sieb=None):
     """Ermittelt die Primfaktorzerlegung einer Zahl n
     mittels Fermats Faktorisierungsmethode und Probedivision
     fuer die beiden Faktoren.
 
     :param n: Zahl, deren Primfaktorzerlegung gesucht ist.
+    :param sieb: Falls True, werden die Kandidaten fuer x vorab
+        ueber ihre Restklassen gesiebt (Standard: fuer n >= 2^32).
     :return: Sortierte Liste (ggf. mit Mehrfacheintraegen)
              aller Primfaktoren.
     """
+    if is_prime(n):
+        return [n]
     if n % 2 == 0:
-        return [2] + fermat_probediv(n // 2)
-    x = math.ceil(math.sqrt(n))
-    r = x * x - n
-    y = math.floor(math.sqrt(r))
-    while y * y != r:
-        r, x = r + 2 * x + 1, x + 1
-        y = math.floor(math.sqrt(r))
-    a, b = x + y, x - y
-    return sorted(probediv(a) + probediv(b))
+        return [2] + fermat_probediv(n // 2, sieb)
+    if sieb is None:
+        sieb = n >= _sieb_grenze
+    a, b = _fermat_sieb(n) if sieb else _fermat_suche(n)
+    factors = []
+    for f in (a, b):
+        factors += [f] if is_prime(f) else probediv(f)
+    return sorted(factors)
 
 
-def fermat(n):
+def fermat(n, sieb=None):
     """Ermittelt die Primfaktorzerlegung einer Zahl n
     mittels rekursiver Anwendung von Fermats
     Faktorisierungsmethode.
 
     :param n: Zahl, deren Primfaktorzerlegung gesucht ist.
+    :param sieb: Falls True, werden die Kandidaten fuer x vorab
+        ueber ihre Restklassen gesiebt (Standard: fuer n >= 2^32).
     :return: Sortierte Liste (ggf. mit Mehrfacheintraegen)
              aller Primfaktoren.
     """
+    if is_prime(n):
+        return [n]
     if n % 2 == 0:
-        return [2] + fermat_probediv(n // 2)
-    x = math.ceil(math.sqrt(n))
-    r = x * x - n
-    y = math.floor(math.sqrt(r))
-    while y * y != r:
-        r, x = r + 2 * x + 1, x + 1
-        y = math.floor(math.sqrt(r))
-    a, b = x + y, x - y
+        return [2] + fermat_probediv(n // 2, sieb)
+    if sieb is None:
+        sieb = n >= _sieb_grenze
+    a, b = _fermat_sieb(n) if sieb else _fermat_suche(n)
     if b == 1:
         return [a]
     else:
-        return sorted(fermat(a) + fermat(b))
+        return sorted(fermat(a, sieb) + fermat(b, sieb))
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+import random
+
+from .sieb import erat_basis
+
+# Kleine Primzahlen fuer die vorgeschaltete Probedivision
+_kleine_primzahlen = tuple(erat_basis(1000))
+
+# Produkt aller kleinen Primzahlen, damit die Probedivision
+# mit einem einzigen ggT erledigt werden kann
+_primorial = math.prod(_kleine_primzahlen)
+
+# Mit den Basen 2, 3, ..., 41 ist der Test fuer alle
+# n < 3317044064679887385961981 deterministisch
+_deterministische_basen = _kleine_primzahlen[:13]
+_deterministische_grenze = 3317044064679887385961981
+
+
+def miller_rabin(n, basen):
+    """Fuehrt den Miller-Rabin-Test fuer eine ungerade Zahl
+    n > 2 mit den gegebenen Basen durch.
+
+    :param n: Ungerade Ganzzahl n > 2.
+    :param basen: Folge von Basen 1 < a < n - 1.
+    :return: False, falls n sicher zusammengesetzt ist,
+             True, falls n fuer alle Basen eine starke
+             Pseudoprimzahl ist.
+    """
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in basen:
+        x = pow(a % n, d, n)
+        if x == 1 or x == n - 1 or x == 0:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n, runden=20):
+    """Prueft, ob n eine Primzahl ist.
+
+    Nach Probedivision durch kleine Primzahlen wird der
+    Miller-Rabin-Test angewandt. Fuer n < 3.3 * 10^24 ist das
+    Ergebnis mit festen Basen exakt, darueber wird mit
+    zufaelligen Basen getestet (Irrtumswahrscheinlichkeit
+    hoechstens 4^(-runden)).
+
+    :param n: Ganzzahl.
+    :param runden: Anzahl zufaelliger Basen fuer grosse n.
+    :return: True, falls n (wahrscheinlich) prim ist.
+    """
+    if n < 2:
+        return False
+    for p in _kleine_primzahlen:
+        if n % p == 0:
+            return n == p
+    return _is_prime_ohne_probedivision(n, runden)
+
+
+def _is_prime_ohne_probedivision(n, runden):
+    """Miller-Rabin-Test fuer n ohne kleine Primfaktoren."""
+    if n < _kleine_primzahlen[-1] ** 2:
+        return True
+    if n < _deterministische_grenze:
+        return miller_rabin(n, _deterministische_basen)
+    basen = [random.randrange(2, n - 1) for _ in range(runden)]
+    return miller_rabin(n, basen)
+
+
+def is_prime_many(zahlen, runden=20):
+    """Prueft fuer alle Zahlen einer Folge, ob sie prim sind.
+
+    Liefert dasselbe wie [is_prime(n, runden) for n in zahlen].
+    Die Probedivision erfolgt je Zahl durch einen ggT mit dem
+    Produkt der kleinen Primzahlen; die Laufzeit wird aber vom
+    Miller-Rabin-Test der verbleibenden Kandidaten bestimmt.
+
+    :param zahlen: Iterierbare Folge von Ganzzahlen.
+    :param runden: Anzahl zufaelliger Basen fuer grosse n.
+    :return: Liste von Wahrheitswerten.
+    """
+    ergebnis = []
+    for n in zahlen:
+        if n < 2:
+            ergebnis.append(False)
+        elif math.gcd(n, _primorial) != 1:
+            ergebnis.append(n <= _kleine_primzahlen[-1] and
+                            n in _kleine_primzahlen)
+        else:
+            ergebnis.append(_is_prime_ohne_probedivision(n, runden))
+    return ergebnis
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+
+from .sieb import erat_segment, primzahltabelle, _segment_sieben
+
+# Bis zu dieser Grenze zaehlt prime_pi() direkt per Sieb
+_sieb_grenze = 10**6
+
+
+def prime_pi(x):
+    """Ermittelt die Anzahl pi(x) der Primzahlen <= x.
+
+    Fuer grosse x wird das Verfahren von Lucy_Hedgehog
+    verwendet, das die Anzahlen S(v) = #{2 <= n <= v, n hat
+    keinen Primfaktor < p} fuer alle v = x // i in O(sqrt(x))
+    Speicher verwaltet und fuer jede Primzahl p <= sqrt(x)
+    ueber die Rekursion
+    S(v) -= S(v // p) - S(p - 1)  fuer v >= p^2
+    aktualisiert. Der Aufwand betraegt O(x^(3/4)).
+
+    :param x: Obere Schranke.
+    :return: Anzahl der Primzahlen <= x.
+    """
+    if x < 2:
+        return 0
+    if x <= _sieb_grenze:
+        basis = primzahltabelle.bis(math.isqrt(x))
+        return _segment_sieben(2, x + 1, basis).count(1)
+
+    r = math.isqrt(x)
+    # klein[v] = S(v) fuer v <= r, gross[i] = S(x // i) fuer i <= r
+    klein = [max(v - 1, 0) for v in range(r + 1)]
+    gross = [0] + [x // i - 1 for i in range(1, r + 1)]
+    for p in primzahltabelle.bis(r):
+        sp, p2 = klein[p - 1], p * p
+        grenze = min(r, x // p2)
+        mitte = min(grenze, r // p)
+        gross[1:mitte + 1] = [gross[i] - gross[i * p] + sp
+                              for i in range(1, mitte + 1)]
+        gross[mitte + 1:grenze + 1] = [gross[i] - klein[x // (i * p)] + sp
+                                       for i in range(mitte + 1, grenze + 1)]
+        if p2 <= r:
+            klein[p2:] = [klein[v] - klein[v // p] + sp
+                          for v in range(p2, r + 1)]
+    return gross[1]
+
+
+def nth_prime(n):
+    """Ermittelt die n-te Primzahl p_n (mit p_1 = 2).
+
+    Ausgehend von der asymptotischen Naeherung
+    p_n ~ n * (ln n + ln ln n - 1 + (ln ln n - 2) / ln n)
+    wird pi() an dieser Stelle exakt berechnet und die
+    Abweichung anschliessend mit einem segmentierten Sieb
+    in die passende Richtung korrigiert.
+
+    :param n: Index der gesuchten Primzahl, n >= 1.
+    :return: n-te Primzahl.
+    """
+    if n < 1:
+        raise ValueError("n < 1")
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    ln = math.log(n)
+    lln = math.log(ln)
+    x = int(n * (ln + lln - 1 + (lln - 2) / ln))
+    c = prime_pi(x)
+    segment = max(math.isqrt(x), 1 << 16)
+    if c < n:
+        # Vorwaerts: Primzahlen in (x, ...)
+        lo = x + 1
+        while True:
+            basis = primzahltabelle.bis(math.isqrt(lo + segment))
+            anzahl = _segment_sieben(lo, lo + segment, basis).count(1)
+            if c + anzahl >= n:
+                return erat_segment(lo, lo + segment)[n - c - 1]
+            c, lo = c + anzahl, lo + segment
+    else:
+        # Rueckwaerts: Primzahlen in (..., x]
+        hi = x + 1
+        while True:
+            lo = max(hi - segment, 2)
+            basis = primzahltabelle.bis(math.isqrt(hi))
+            anzahl = _segment_sieben(lo, hi, basis).count(1)
+            if c - anzahl < n:
+                return erat_segment(lo, hi)[n - (c - anzahl) - 1]
+            c, hi = c - anzahl, lo
@@ -0,0 +1,293 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+import mmap
+import multiprocessing
+from array import array
+from bisect import bisect_right
+from functools import partial
+from itertools import compress, islice
+from multiprocessing import shared_memory
+
+
+def erat_basis(N):
+    """Ermittelt alle Primzahlen kleiner oder gleich N
+    mittels des Sieb des Erathostenes auf einem Bytefeld.
+
+    Im Gegensatz zu erat() werden Vielfache per Slice-
+    Zuweisung gestrichen und das Ergebnis als kompaktes
+    Feld von 64-Bit-Ganzzahlen zurueckgegeben.
+
+    :param N: Obere Schranke fuer Primzahlen.
+    :return: Sortiertes array('Q') aller Primzahlen <= N.
+    """
+    if N < 2:
+        return array('Q')
+    sieb = bytearray([1]) * (N + 1)
+    sieb[0] = sieb[1] = 0
+    for i in range(2, math.isqrt(N) + 1):
+        if sieb[i]:
+            sieb[i * i::i] = bytes(len(range(i * i, N + 1, i)))
+    return array('Q', compress(range(N + 1), sieb))
+
+
+def _segment_sieben(lo, hi, basis):
+    """Streicht im Intervall [lo, hi) alle Vielfachen der
+    Basisprimzahlen und liefert das Bytefeld, in dem genau
+    die Primzahlen mit 1 markiert sind.
+    """
+    sieb = bytearray([1]) * (hi - lo)
+    for p in basis:
+        if p * p >= hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p) - lo
+        sieb[start::p] = bytes(len(range(start, hi - lo, p)))
+    return sieb
+
+
+def erat_segment(lo, hi, basis=None):
+    """Ermittelt alle Primzahlen im Intervall [lo, hi)
+    mittels eines segmentierten Sieb des Erathostenes.
+
+    :param lo: Untere Schranke (inklusive).
+    :param hi: Obere Schranke (exklusive).
+    :param basis: Aufsteigende Folge aller Primzahlen bis
+        mindestens sqrt(hi) (optional).
+    :return: Sortiertes array('Q') der Primzahlen in [lo, hi).
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return array('Q')
+    if basis is None:
+        basis = primzahltabelle.bis(math.isqrt(hi - 1))
+    sieb = _segment_sieben(lo, hi, basis)
+    return array('Q', compress(range(lo, hi), sieb))
+
+
+class PrimzahlTabelle:
+    """Prozessweite Tabelle aller Primzahlen bis zu einer
+    Grenze, die bei Bedarf durch segmentiertes Sieben
+    erweitert wird.
+
+    Die Tabelle kann in eine Datei geschrieben und von dort
+    per mmap ohne erneutes Sieben eingeblendet werden.
+    """
+
+    def __init__(self):
+        """Erstellt eine leere Tabelle."""
+        self.grenze = 1
+        self._primzahlen = array('Q')
+
+    def __len__(self):
+        """Liefert die Anzahl der gespeicherten Primzahlen."""
+        return len(self._primzahlen)
+
+    def erweitern(self, N):
+        """Erweitert die Tabelle um alle Primzahlen <= N.
+
+        Die Grenze wird mindestens verdoppelt, damit viele
+        kleine Erweiterungen nicht jeweils neu sieben.
+        """
+        if N <= self.grenze:
+            return
+        N = max(N, 2 * self.grenze)
+        basis = self.bis(math.isqrt(N))
+        neu = _segment_sieben(self.grenze + 1, N + 1, basis)
+        if not isinstance(self._primzahlen, array):
+            # Eingeblendete Datei ist schreibgeschuetzt
+            self._primzahlen = array('Q', self._primzahlen)
+        self._primzahlen.extend(compress(range(self.grenze + 1, N + 1),
+                                         neu))
+        self.grenze = N
+
+    def bis(self, N):
+        """Liefert einen Iterator ueber alle Primzahlen <= N
+        in aufsteigender Reihenfolge."""
+        self.erweitern(N)
+        return islice(self._primzahlen, bisect_right(self._primzahlen, N))
+
+    def speichern(self, pfad):
+        """Schreibt die Tabelle in eine Datei, die mit
+        laden() wieder eingeblendet werden kann."""
+        with open(pfad, 'wb') as datei:
+            datei.write(array('Q', [self.grenze]).tobytes())
+            datei.write(self._primzahlen.tobytes())
+
+    def laden(self, pfad):
+        """Blendet eine mit speichern() geschriebene Tabelle
+        per mmap ein, sofern sie groesser als die aktuelle ist.
+        """
+        with open(pfad, 'rb') as datei:
+            daten = mmap.mmap(datei.fileno(), 0, access=mmap.ACCESS_READ)
+        werte = memoryview(daten).cast('Q')
+        if werte[0] > self.grenze:
+            self.grenze, self._primzahlen = werte[0], werte[1:]
+
+
+# Gemeinsame Primzahltabelle aller Funktionen dieses Pakets
+primzahltabelle = PrimzahlTabelle()
+
+
+# Basisprimzahlen im gemeinsamen Speicher, wird in jedem
+# Arbeitsprozess von _arbeiter_init() gesetzt.
+_arbeiter_speicher = None
+_arbeiter_basis = None
+
+
+def _arbeiter_init(name, anzahl):
+    """Bindet den gemeinsamen Speicher mit den Basis-
+    primzahlen in einem Arbeitsprozess ein."""
+    global _arbeiter_speicher, _arbeiter_basis
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 kennt den Parameter track nicht
+        shm = shared_memory.SharedMemory(name=name)
+    _arbeiter_speicher = shm
+    _arbeiter_basis = shm.buf.cast('Q')[:anzahl]
+
+
+def _arbeiter_sieben(intervall, zaehlen):
+    """Siebt ein Segment in einem Arbeitsprozess und liefert
+    die Anzahl oder die Primzahlen als Bytes zurueck."""
+    lo, hi = intervall
+    sieb = _segment_sieben(lo, hi, _arbeiter_basis)
+    if zaehlen:
+        return sieb.count(1)
+    return array('Q', compress(range(lo, hi), sieb)).tobytes()
+
+
+def erat_parallel(lo, hi, prozesse=None, segment=1 << 20, zaehlen=False):
+    """Ermittelt alle Primzahlen im Intervall [lo, hi) mittels
+    eines segmentierten Sieb des Erathostenes, dessen Segmente
+    auf mehrere Prozesse verteilt werden.
+
+    Die Basisprimzahlen bis sqrt(hi) werden einmalig gesiebt
+    und ueber gemeinsamen Speicher an alle Prozesse verteilt.
+    Die Ergebnisse der Segmente werden in aufsteigender
+    Reihenfolge zusammengesetzt.
+
+    :param lo: Untere Schranke (inklusive).
+    :param hi: Obere Schranke (exklusive).
+    :param prozesse: Anzahl Prozesse (Standard: Anzahl CPUs).
+    :param segment: Laenge eines Segments.
+    :param zaehlen: Falls True, wird nur die Anzahl geliefert.
+    :return: Anzahl der Primzahlen in [lo, hi) oder sortiertes
+             array('Q') dieser Primzahlen.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return 0 if zaehlen else array('Q')
+
+    basis = array('Q', primzahltabelle.bis(math.isqrt(hi - 1)))
+    if not basis:
+        # hi <= 4: es gibt nichts zu verteilen
+        sieb = _segment_sieben(lo, hi, basis)
+        if zaehlen:
+            return sieb.count(1)
+        return array('Q', compress(range(lo, hi), sieb))
+    groesse = basis.itemsize * len(basis)
+    shm = shared_memory.SharedMemory(create=True, size=groesse)
+    try:
+        shm.buf[:groesse] = basis.tobytes()
+        segmente = [(a, min(a + segment, hi))
+                    for a in range(lo, hi, segment)]
+        with multiprocessing.Pool(prozesse, initializer=_arbeiter_init,
+                                  initargs=(shm.name, len(basis))) as pool:
+            teile = pool.imap(partial(_arbeiter_sieben, zaehlen=zaehlen),
+                              segmente)
+            if zaehlen:
+                return sum(teile)
+            primzahlen = array('Q')
+            for teil in teile:
+                primzahlen.frombytes(teil)
+            return primzahlen
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def spf_sieb(N):
+    """Ermittelt fuer alle 0 <= n <= N den kleinsten Primfaktor.
+
+    Die Primzahlen bis sqrt(N) werden in absteigender
+    Reihenfolge durchlaufen und ueberschreiben per Slice-
+    Zuweisung ihre Vielfachen, sodass am Ende jeder Eintrag
+    den kleinsten Primfaktor enthaelt. Eintraege 0 und 1
+    sind 0, Primzahlen enthalten sich selbst.
+
+    :param N: Obere Schranke.
+    :return: Kompaktes array der Laenge N + 1.
+    """
+    typ = 'I' if N < 1 << 32 else 'Q'
+    spf = array(typ, range(N + 1))
+    spf[:2] = array(typ, [0] * min(2, N + 1))
+    for p in reversed(list(primzahltabelle.bis(math.isqrt(N)))):
+        spf[p * p::p] = array(typ, [p]) * len(range(p * p, N + 1, p))
+    return spf
+
+
+class SPFTabelle:
+    """Tabelle der kleinsten Primfaktoren aller Zahlen bis N,
+    mit der sich jede Zahl n <= N in O(log n) Schritten in
+    Primfaktoren zerlegen laesst.
+    """
+
+    def __init__(self, N):
+        """Erstellt die Tabelle fuer alle Zahlen <= N."""
+        self.N = N
+        self.spf = spf_sieb(N)
+
+    def factor(self, n):
+        """Ermittelt die Primfaktorzerlegung einer Zahl n <= N.
+
+        :param n: Zahl, deren Primfaktorzerlegung gesucht ist.
+        :return: Sortierte Liste (ggf. mit Mehrfacheintraegen)
+                 aller Primfaktoren.
+        """
+        if n > self.N:
+            raise ValueError("n > N")
+        spf, factors = self.spf, []
+        while n > 1:
+            p = spf[n]
+            factors.append(p)
+            n //= p
+        return factors
+
+    def factor_range(self, lo, hi):
+        """Liefert nacheinander die Primfaktorzerlegungen
+        aller Zahlen im Intervall [lo, hi).
+
+        :param lo: Untere Schranke (inklusive).
+        :param hi: Obere Schranke (exklusive), hi <= N + 1.
+        :return: Generator ueber sortierte Listen von Primfaktoren.
+        """
+        if hi > self.N + 1:
+            raise ValueError("hi > N + 1")
+        for n in range(lo, hi):
+            yield self.factor(n)
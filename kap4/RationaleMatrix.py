@@ -0,0 +1,222 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import math
+
+from .RationaleZahl import RationaleZahl
+
+
+def _bareiss(a, spalten):
+    """Bringt die ganzzahlige Matrix a (Liste von Zeilen) mit dem
+    divisionsfreien Verfahren von Bareiss auf Stufenform.
+
+    Die Pivotelemente werden in den ersten 'spalten' Spalten
+    gesucht; die uebrigen Spalten (z.B. rechte Seiten) werden
+    mit umgeformt. Nach der Umformung ist jeder Eintrag ein
+    Minor der Ausgangsmatrix, sodass alle Divisionen durch das
+    vorherige Pivotelement aufgehen und die Eintraege nur linear
+    in der Zeilenanzahl wachsen.
+
+    :param a: Liste von Zeilen ganzer Zahlen, wird veraendert.
+    :param spalten: Anzahl der Spalten, in denen Pivotelemente
+                    gesucht werden.
+    :return: Tupel (pivotspalten, vorzeichen) mit der Liste der
+             Spalten der Pivotelemente und dem Vorzeichen der
+             Zeilenvertauschungen.
+    """
+    zeilen = len(a)
+    pivotspalten, vorzeichen, p_alt, r = [], 1, 1, 0
+    for c in range(spalten):
+        if r == zeilen:
+            break
+        k = next((i for i in range(r, zeilen) if a[i][c] != 0), None)
+        if k is None:
+            continue
+        if k != r:
+            a[r], a[k] = a[k], a[r]
+            vorzeichen = -vorzeichen
+        zr = a[r][c:]
+        p = zr[0]
+        for i in range(r + 1, zeilen):
+            zi = a[i]
+            f = zi[c]
+            zi[c:] = [(p * x - f * y) // p_alt
+                      for x, y in zip(zi[c:], zr)]
+        pivotspalten.append(c)
+        p_alt, r = p, r + 1
+    return pivotspalten, vorzeichen
+
+
+def _rueckwaerts(a, n, D):
+    """Loest das durch _bareiss() auf obere Dreiecksform gebrachte
+    n x n-System mit den rechten Seiten in den Spalten ab n
+    divisionsfrei; D ist das letzte Pivotelement.
+
+    :return: Liste der Loesungsspalten y, die Loesungen sind y / D.
+    """
+    loesungen = []
+    for s in range(n, len(a[0]) if a else n):
+        y = n * [0]
+        for i in range(n - 1, -1, -1):
+            zi = a[i]
+            t = D * zi[s] - sum(zi[j] * y[j] for j in range(i + 1, n))
+            y[i] = t // zi[i]
+        loesungen.append(y)
+    return loesungen
+
+
+class RationaleMatrix:
+    """Datentyp fuer Matrizen mit rationalen Eintraegen.
+
+    Die Matrix wird als ganzzahlige Matrix von Zaehlern mit einem
+    gemeinsamen Nenner gespeichert, sodass das Loesen von
+    Gleichungssystemen, Determinante, Inverse und Rang mit dem
+    divisionsfreien Verfahren von Bareiss ausschliesslich auf
+    ganzen Zahlen arbeiten. Erst die Ergebnisse werden gekuerzt
+    und als RationaleZahl geliefert.
+    """
+
+    def __init__(self, zeilen):
+        """Erstellt eine Matrix aus einer Liste von Zeilen, deren
+        Eintraege Ganzzahlen, Gleitkommazahlen, Brueche vom Typ
+        Fraction oder rationale Zahlen sind.
+        """
+        zeilen = [[RationaleZahl._aus(x) for x in zeile]
+                  for zeile in zeilen]
+        if len({len(zeile) for zeile in zeilen}) > 1:
+            raise ValueError("Zeilen unterschiedlicher Laenge")
+        self._nenner = math.lcm(*(x.n for zeile in zeilen
+                                  for x in zeile))
+        self._zaehler = [[x.m * (self._nenner // x.n) for x in zeile]
+                         for zeile in zeilen]
+
+    @classmethod
+    def _neu(cls, zaehler, nenner):
+        """Erstellt eine Matrix aus ganzzahligen Zaehlern und
+        einem gemeinsamen Nenner > 0."""
+        A = object.__new__(cls)
+        A._zaehler, A._nenner = zaehler, nenner
+        return A
+
+    @property
+    def zeilen(self):
+        """Liefert die Anzahl der Zeilen."""
+        return len(self._zaehler)
+
+    @property
+    def spalten(self):
+        """Liefert die Anzahl der Spalten."""
+        return len(self._zaehler[0]) if self._zaehler else 0
+
+    def __getitem__(self, ij):
+        """Liefert den Eintrag in Zeile i und Spalte j."""
+        i, j = ij
+        return RationaleZahl(self._zaehler[i][j], self._nenner)
+
+    def als_liste(self):
+        """Liefert die Matrix als Liste von Zeilen rationaler
+        Zahlen."""
+        return [[RationaleZahl(x, self._nenner) for x in zeile]
+                for zeile in self._zaehler]
+
+    def __repr__(self):
+        """Liefert Python-Repraesentation der Matrix."""
+        return 'RationaleMatrix({})'.format(self.als_liste())
+
+    def _quadratisch(self):
+        """Prueft, ob die Matrix quadratisch ist."""
+        if self.zeilen != self.spalten:
+            raise ValueError("Matrix ist nicht quadratisch")
+
+    def rang(self):
+        """Bestimmt den Rang der Matrix.
+
+        :return: Rang der Matrix.
+        """
+        a = [zeile[:] for zeile in self._zaehler]
+        return len(_bareiss(a, self.spalten)[0])
+
+    def determinante(self):
+        """Bestimmt die Determinante der quadratischen Matrix.
+
+        :return: Determinante als rationale Zahl.
+        """
+        self._quadratisch()
+        n = self.zeilen
+        if n == 0:
+            return RationaleZahl(1)
+        a = [zeile[:] for zeile in self._zaehler]
+        pivotspalten, vorzeichen = _bareiss(a, n)
+        if len(pivotspalten) < n:
+            return RationaleZahl(0)
+        return RationaleZahl(vorzeichen * a[-1][-1], self._nenner ** n)
+
+    def _loesen(self, b, e):
+        """Loest A * X = B / e fuer die ganzzahlige Matrix B (Liste
+        von Zeilen) und liefert die Spalten von X als Zaehler
+        zusammen mit dem gemeinsamen Nenner."""
+        self._quadratisch()
+        n = self.zeilen
+        a = [zeile + bi for zeile, bi in zip(self._zaehler, b)]
+        if len(_bareiss(a, n)[0]) < n:
+            raise ValueError("Matrix ist singulaer")
+        D = a[-1][n - 1]
+        # A = Z / d, also X = d * Z^(-1) * B / e = d * Y / (D * e)
+        y = _rueckwaerts(a, n, D)
+        faktor, nenner = self._nenner, D * e
+        if nenner < 0:
+            faktor, nenner = -faktor, -nenner
+        return [[faktor * x for x in spalte] for spalte in y], nenner
+
+    def loese(self, b):
+        """Loest das lineare Gleichungssystem A * x = b.
+
+        :param b: Liste der rechten Seiten (Ganzzahlen, Gleitkomma-
+                  zahlen, Brueche oder rationale Zahlen).
+        :return: Loesung x als Liste rationaler Zahlen.
+        """
+        b = [RationaleZahl._aus(x) for x in b]
+        if len(b) != self.zeilen:
+            raise ValueError("Dimension der rechten Seite passt nicht")
+        e = math.lcm(*(x.n for x in b))
+        (x,), nenner = self._loesen([[x.m * (e // x.n)] for x in b], e)
+        return [RationaleZahl(xi, nenner) for xi in x]
+
+    def inverse(self):
+        """Bestimmt die Inverse der quadratischen Matrix.
+
+        :return: Inverse als RationaleMatrix.
+        """
+        n = self.zeilen
+        einheit = [[int(i == j) for j in range(n)] for i in range(n)]
+        if n == 0:
+            return RationaleMatrix._neu([], 1)
+        spalten, nenner = self._loesen(einheit, 1)
+        zaehler = [list(zeile) for zeile in zip(*spalten)]
+        g = math.gcd(nenner, *(x for zeile in zaehler for x in zeile))
+        return RationaleMatrix._neu([[x // g for x in zeile]
+                                     for zeile in zaehler], nenner // g)
@@ -25,51 +25,208 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from .ggt import ggt
+import contextlib
+import math
+import numbers
+import operator
+import sys
+from fractions import Fraction
+
+from .ggt import ggt_auto
+
+
+def _verhaeltnis(x):
+    """Zerlegt eine Ganzzahl, Gleitkommazahl oder rationale Zahl
+    exakt in ein Paar (Zaehler, Nenner)."""
+    if isinstance(x, float):
+        return x.as_integer_ratio()
+    if isinstance(x, numbers.Rational):
+        return x.numerator, x.denominator
+    raise TypeError("Zaehler und Nenner muessen rationale Zahlen sein, "
+                    "nicht {}".format(type(x).__name__))
 
 
 class RationaleZahl:
     """Datentyp zur Darstellung von und dem Rechnen mit
     komplexen Zahlen.
+
+    Die arithmetischen Operationen folgen den Algorithmen von
+    Henrici (siehe Knuth, TAOCP Bd. 2, 4.5.1): Es werden nur
+    ggTs kleinerer Zahlen gebildet, sodass die Ergebnisse ohne
+    abschliessendes Kuerzen bereits gekuerzt sind.
+
+    Ist das Klassenattribut kuerzen_ab auf eine Bitlaenge gesetzt
+    (siehe verzoegert()), werden Summen, Produkte und Quotienten
+    ungekuerzt gebildet und erst gekuerzt, sobald Zaehler oder
+    Nenner seit dem letzten Kuerzen um mehr als diese Bitlaenge
+    gewachsen sind oder die Zahl verglichen, ausgegeben, gehasht
+    oder nach Zaehler und Nenner gefragt wird.
+
+    Da rationale Zahlen hashbar sind, koennen Zaehler und Nenner
+    nach der Erzeugung nicht mehr geaendert werden.
     """
 
+    # _basis ist None fuer gekuerzte Zahlen und sonst die
+    # Bitlaenge der Operanden beim letzten Kuerzen
+    __slots__ = ('_m', '_n', '_basis')
+
+    # Zuwachs der Bitlaenge, ab dem im verzoegerten Modus gekuerzt
+    # wird; None, um jedes Ergebnis sofort zu kuerzen
+    kuerzen_ab = None
+
     def __init__(self, m=0, n=1):
         """Erstellt eine rationale Zahl mit angegebenem
         Zaehler m und Nenner n.
+
+        Zaehler und Nenner koennen auch Gleitkommazahlen oder
+        Brueche sein; die Zahl erhaelt dann exakt den Wert m / n.
         """
+        if not (isinstance(m, int) and isinstance(n, int)):
+            (a, b), (c, d) = _verhaeltnis(m), _verhaeltnis(n)
+            m, n = a * d, b * c
         s = -1 if m * n < 0 else 1
-        self.m, self.n = s * abs(m), abs(n)
+        self._m, self._n = s * abs(m), abs(n)
         self.kuerzen()
 
+    @classmethod
+    def _neu(cls, m, n, basis=None):
+        """Erstellt eine rationale Zahl aus Zaehler m und
+        Nenner n > 0 ohne Normierung."""
+        q = object.__new__(cls)
+        q._m, q._n, q._basis = m, n, basis
+        return q
+
+    def _bits(self):
+        """Liefert die Bitlaenge der Zahl beim letzten Kuerzen."""
+        if self._basis is None:
+            return max(self._m.bit_length(), self._n.bit_length())
+        return self._basis
+
+    def _verzoegert(self, other, m, n):
+        """Erstellt das ungekuerzte Ergebnis m/n (n > 0) einer
+        Operation von self und other, das erst gekuerzt wird,
+        wenn es um mehr als kuerzen_ab Bits ueber die Operanden
+        hinaus gewachsen ist."""
+        basis = max(self._bits(), other._bits())
+        q = RationaleZahl._neu(m, n, basis)
+        if max(m.bit_length(), n.bit_length()) > \
+                basis + RationaleZahl.kuerzen_ab:
+            q.kuerzen()
+        return q
+
+    @classmethod
+    @contextlib.contextmanager
+    def verzoegert(cls, bits=1 << 14):
+        """Kontextmanager, in dem Ergebnisse erst gekuerzt
+        werden, wenn Zaehler oder Nenner seit dem letzten
+        Kuerzen um mehr als die angegebene Bitlaenge gewachsen
+        sind.
+
+        :param bits: Zuwachs der Bitlaenge, ab dem gekuerzt wird.
+        """
+        alt, RationaleZahl.kuerzen_ab = RationaleZahl.kuerzen_ab, bits
+        try:
+            yield
+        finally:
+            RationaleZahl.kuerzen_ab = alt
+
+    @classmethod
+    def _aus(cls, other):
+        """Wandelt other in eine rationale Zahl, sofern es
+        noch keine ist."""
+        if isinstance(other, RationaleZahl):
+            return other
+        if isinstance(other, int):
+            return cls._neu(other, 1)
+        if isinstance(other, Fraction):
+            return cls.aus_fraction(other)
+        if isinstance(other, float):
+            return cls.aus_float(other)
+        return cls(other)
+
+    @classmethod
+    def aus_float(cls, x):
+        """Erstellt die rationale Zahl, die exakt dem Wert der
+        Gleitkommazahl x entspricht.
+
+        :param x: Endliche Gleitkommazahl.
+        :return: Rationale Zahl mit Wert x.
+        """
+        return cls._neu(*x.as_integer_ratio())
+
+    @classmethod
+    def aus_fraction(cls, f):
+        """Erstellt eine rationale Zahl aus einem Bruch vom Typ
+        fractions.Fraction ohne erneutes Kuerzen.
+
+        :param f: Bruch vom Typ Fraction.
+        :return: Rationale Zahl mit Wert f.
+        """
+        return cls._neu(f.numerator, f.denominator)
+
+    def als_fraction(self):
+        """Wandelt die rationale Zahl in einen Bruch vom Typ
+        fractions.Fraction um.
+
+        :return: Bruch vom Typ Fraction.
+        """
+        self._normieren()
+        return Fraction(self._m, self._n)
+
     def kuerzen(self):
         """Ermittelt den groessten gemeinsamen Teiler von
         Zaehler und Nenner und dividiert beide durch diesen.
         """
-        d = ggt(abs(self.m), self.n)
-        self.m, self.n = self._m // d, self.n // d
+        d = ggt_auto(self._m, self._n)
+        self._m, self._n = self._m // d, self._n // d
+        self._basis = None
+
+    def _normieren(self):
+        """Kuerzt die rationale Zahl, falls sie im verzoegerten
+        Modus ungekuerzt entstanden ist."""
+        if self._basis is not None:
+            self.kuerzen()
 
     @property
     def m(self):
         """Liefert den Zaehler der rationalen Zahl."""
+        self._normieren()
+        return self._m
+
+    @property
+    def numerator(self):
+        """Liefert den Zaehler (Schnittstelle numbers.Rational)."""
+        self._normieren()
         return self._m
 
-    @m.setter
-    def m(self, m):
-        """Aendert den Zaehler der rationalen Zahl."""
-        self._m = int(m)
+    @property
+    def denominator(self):
+        """Liefert den Nenner (Schnittstelle numbers.Rational)."""
+        self._normieren()
+        return self._n
+
+    @property
+    def real(self):
+        """Liefert den Realteil, also die Zahl selbst
+        (Schnittstelle numbers.Real)."""
+        return +self
+
+    @property
+    def imag(self):
+        """Liefert den Imaginaerteil 0 (Schnittstelle numbers.Real)."""
+        return 0
+
+    def conjugate(self):
+        """Liefert die konjugiert komplexe Zahl, also die Zahl
+        selbst (Schnittstelle numbers.Real)."""
+        return +self
 
     @property
     def n(self):
         """Liefert den Nenner der rationalen Zahl."""
+        self._normieren()
         return self._n
 
-    @n.setter
-    def n(self, n):
-        """Aendert den Nenner der rationalen Zahl."""
-        if n < 0:
-            raise ValueError("Nenner < 0")
-        self._n = int(n)
-
     def __str__(self):
         """Wandelt die rationale Zahl in eine Zeichenkette"""
         return '{}/{}'.format(self.m, self.n)
@@ -80,54 +237,259 @@ class RationaleZahl:
 
     def __abs__(self):
         """Liefert den Betrag der rationalen Zahl."""
-        return RationaleZahl(abs(self.m), self.n)
+        return RationaleZahl._neu(abs(self._m), self._n, self._basis)
 
     def __pos__(self):
         """Operator '+q'."""
-        return RationaleZahl(self.m, self.n)
+        return RationaleZahl._neu(self._m, self._n, self._basis)
 
     def __neg__(self):
         """Operator '-q'."""
-        return RationaleZahl(-self.m, self.n)
+        return RationaleZahl._neu(-self._m, self._n, self._basis)
+
+    def __float__(self):
+        """Wandelt die rationale Zahl in eine Gleitkommazahl."""
+        return self._m / self._n
+
+    def __bool__(self):
+        """Prueft, ob die rationale Zahl ungleich Null ist."""
+        return self._m != 0
+
+    def __trunc__(self):
+        """Rundet die rationale Zahl in Richtung Null."""
+        if self._m < 0:
+            return -(-self._m // self._n)
+        return self._m // self._n
+
+    def __int__(self):
+        """Wandelt die rationale Zahl durch Abschneiden der
+        Nachkommastellen in eine Ganzzahl."""
+        return self.__trunc__()
+
+    def __floor__(self):
+        """Rundet die rationale Zahl ab."""
+        return self._m // self._n
+
+    def __ceil__(self):
+        """Rundet die rationale Zahl auf."""
+        return -(-self._m // self._n)
+
+    def __round__(self, ndigits=None):
+        """Rundet die rationale Zahl auf ndigits Nachkommastellen,
+        bei Gleichstand zur geraden Zahl (wie Fraction).
+
+        :param ndigits: Anzahl Nachkommastellen (optional).
+        :return: Ganzzahl, falls ndigits None ist, sonst
+                 rationale Zahl.
+        """
+        if ndigits is None:
+            self._normieren()
+            q, r = divmod(self._m, self._n)
+            if 2 * r < self._n or (2 * r == self._n and q % 2 == 0):
+                return q
+            return q + 1
+        skala = RationaleZahl._neu(10 ** abs(ndigits), 1)
+        if ndigits > 0:
+            return RationaleZahl._aus(round(self * skala)) / skala
+        return RationaleZahl._aus(round(self / skala)) * skala
+
+    def __hash__(self):
+        """Liefert denselben Hashwert wie der gleichwertige
+        Bruch vom Typ Fraction bzw. die gleichwertige Ganzzahl
+        (siehe Fraction.__hash__)."""
+        self._normieren()
+        try:
+            dinv = pow(self._n, -1, sys.hash_info.modulus)
+        except ValueError:
+            h = sys.hash_info.inf
+        else:
+            h = hash(hash(abs(self._m)) * dinv)
+        h = h if self._m >= 0 else -h
+        return -2 if h == -1 else h
 
     def __eq__(self, other):
         """Prueft Gleichheit der rationalen Zahl mit einem
         anderen Objekt."""
-        return (isinstance(other, RationaleZahl) and
-                other.m == self.m and other.n == self.n)
+        if isinstance(other, float):
+            if not math.isfinite(other):
+                return False
+        elif not isinstance(other, (RationaleZahl, int, Fraction)):
+            return NotImplemented
+        other = RationaleZahl._aus(other)
+        self._normieren()
+        other._normieren()
+        return other._m == self._m and other._n == self._n
+
+    def _vergleichen(self, other, op):
+        """Vergleicht die rationale Zahl mittels op mit einer
+        anderen Zahl durch Kreuzmultiplikation."""
+        if isinstance(other, float):
+            if not math.isfinite(other):
+                return op(0., other)
+        elif not isinstance(other, (RationaleZahl, int, Fraction)):
+            return NotImplemented
+        other = RationaleZahl._aus(other)
+        self._normieren()
+        other._normieren()
+        return op(self._m * other._n, other._m * self._n)
+
+    def __lt__(self, other):
+        """Prueft ob die Zahl kleiner als eine andere Zahl ist."""
+        return self._vergleichen(other, operator.lt)
 
     def __le__(self, other):
         """Prueft ob die Zahl kleiner oder gleich einer
         anderen Zahl ist."""
-        if not isinstance(other, RationaleZahl):
-            other = RationaleZahl(other)
-        return self.m * other.n <= other.m * self.n
+        return self._vergleichen(other, operator.le)
+
+    def __gt__(self, other):
+        """Prueft ob die Zahl groesser als eine andere Zahl ist."""
+        return self._vergleichen(other, operator.gt)
+
+    def __ge__(self, other):
+        """Prueft ob die Zahl groesser oder gleich einer
+        anderen Zahl ist."""
+        return self._vergleichen(other, operator.ge)
+
+    def _addieren(self, other, vorzeichen=1):
+        """Addiert a/b = self und c/d = vorzeichen * other.
+
+        Mit d1 = ggt(b, d) ist t = a * d/d1 + c * b/d1 nur noch
+        durch Teiler von d1 kuerzbar, sodass der zweite ggT auf
+        d1 statt auf dem vollen Nenner gebildet wird.
+        """
+        a, b, c, d = self._m, self._n, vorzeichen * other._m, other._n
+        if RationaleZahl.kuerzen_ab is not None:
+            return self._verzoegert(other, a * d + c * b, b * d)
+        d1 = ggt_auto(b, d)
+        if d1 == 1:
+            return RationaleZahl._neu(a * d + c * b, b * d)
+        t = a * (d // d1) + c * (b // d1)
+        d2 = ggt_auto(t, d1)
+        return RationaleZahl._neu(t // d2, (b // d1) * (d // d2))
+
+    def _multiplizieren(self, other, kehrwert=False):
+        """Multipliziert a/b = self mit c/d = other bzw. dessen
+        Kehrwert durch Kreuzkuerzen vor der Multiplikation."""
+        a, b = self._m, self._n
+        if kehrwert:
+            c, d = other._n, other._m
+            if d == 0:
+                raise ZeroDivisionError("Division durch Null")
+            if d < 0:
+                c, d = -c, -d
+        else:
+            c, d = other._m, other._n
+        if RationaleZahl.kuerzen_ab is not None:
+            return self._verzoegert(other, a * c, b * d)
+        g1, g2 = ggt_auto(a, d), ggt_auto(c, b)
+        return RationaleZahl._neu((a // g1) * (c // g2),
+                                  (b // g2) * (d // g1))
+
+    def _operand(self, other):
+        """Wandelt other in eine rationale Zahl und kuerzt
+        ausserhalb des verzoegerten Modus beide Operanden, wie
+        es die Verfahren von Henrici voraussetzen."""
+        other = RationaleZahl._aus(other)
+        if RationaleZahl.kuerzen_ab is None:
+            self._normieren()
+            other._normieren()
+        return other
 
     def __add__(self, other):
         """Addiert rationale Zahl zu einer anderen Zahl."""
-        if not isinstance(other, RationaleZahl):
-            other = RationaleZahl(other)
-        m = self.m * other.n + other.m * self.n
-        n = self.n * other.n
-        return RationaleZahl(m, n)
+        return self._addieren(self._operand(other))
 
     def __sub__(self, other):
         """Subtrahiert eine andere Zahl von der rat. Zahl."""
-        return self + (-other)
+        return self._addieren(self._operand(other), -1)
 
     def __mul__(self, other):
         """Multipliziert die rationale Zahl mit einer Zahl"""
-        if not isinstance(other, RationaleZahl):
-            other = RationaleZahl(other)
-        m, n = self.m * other.m, self.n * other.n
-        return RationaleZahl(m, n)
+        return self._multiplizieren(self._operand(other))
 
     def __truediv__(self, other):
         """Dividiert die komplexe Zahl durch andere Zahl."""
-        if not isinstance(other, RationaleZahl):
-            other = RationaleZahl(other)
-        m, n = self.m * other.n, self.n * other.m
-        return RationaleZahl(m, n)
+        return self._multiplizieren(self._operand(other), True)
+
+    def __divmod__(self, other):
+        """Liefert ganzzahligen Quotienten und Rest der Division
+        durch eine andere Zahl, sodass self = q * other + r mit
+        r von gleichem Vorzeichen wie other gilt."""
+        if isinstance(other, float):
+            return divmod(float(self), other)
+        if not isinstance(other, (RationaleZahl, int, Fraction)):
+            return NotImplemented
+        other = self._operand(other)
+        a, b, c, d = self._m, self._n, other._m, other._n
+        if c == 0:
+            raise ZeroDivisionError("Division durch Null")
+        q, r = divmod(a * d, b * c)
+        return q, RationaleZahl(r, b * d)
+
+    def __rdivmod__(self, other):
+        """Umgekehrte ganzzahlige Division mit Rest."""
+        if isinstance(other, float):
+            return divmod(other, float(self))
+        if not isinstance(other, (int, Fraction)):
+            return NotImplemented
+        return divmod(RationaleZahl._aus(other), self)
+
+    def __floordiv__(self, other):
+        """Ganzzahlige Division durch eine andere Zahl."""
+        ergebnis = self.__divmod__(other)
+        return ergebnis if ergebnis is NotImplemented else ergebnis[0]
+
+    def __rfloordiv__(self, other):
+        """Umgekehrte ganzzahlige Division."""
+        ergebnis = self.__rdivmod__(other)
+        return ergebnis if ergebnis is NotImplemented else ergebnis[0]
+
+    def __mod__(self, other):
+        """Rest der ganzzahligen Division durch eine andere Zahl."""
+        ergebnis = self.__divmod__(other)
+        return ergebnis if ergebnis is NotImplemented else ergebnis[1]
+
+    def __rmod__(self, other):
+        """Umgekehrter Rest der ganzzahligen Division."""
+        ergebnis = self.__rdivmod__(other)
+        return ergebnis if ergebnis is NotImplemented else ergebnis[1]
+
+    def __pow__(self, k):
+        """Potenziert die rationale Zahl mit einem Exponenten.
+
+        Fuer ganzzahlige Exponenten ist das Ergebnis wieder eine
+        rationale Zahl, ansonsten eine Gleitkommazahl (bzw. eine
+        komplexe Zahl fuer komplexe Exponenten).
+        """
+        if isinstance(k, numbers.Rational) and k.denominator == 1:
+            k = k.numerator
+        if not isinstance(k, int):
+            if isinstance(k, numbers.Complex):
+                return float(self) ** k
+            return NotImplemented
+        self._normieren()
+        if k >= 0:
+            return RationaleZahl._neu(self._m ** k, self._n ** k)
+        if self._m == 0:
+            raise ZeroDivisionError("Division durch Null")
+        m, n = (self._n, self._m) if self._m > 0 else \
+            (-self._n, -self._m)
+        return RationaleZahl._neu(m ** -k, n ** -k)
+
+    def __rpow__(self, other):
+        """Potenziert eine Zahl mit der rationalen Zahl.
+
+        Wie bei Fraction ist das Ergebnis fuer ganzzahlige
+        Exponenten und rationale Basen exakt.
+        """
+        if self.n == 1 and isinstance(other, numbers.Rational):
+            if isinstance(other, int) and self.m >= 0:
+                return other ** self.m
+            return RationaleZahl._aus(other) ** self.m
+        if isinstance(other, numbers.Complex):
+            return other ** float(self)
+        return NotImplemented
 
     def __radd__(self, other):
         """Kommutation der Addition."""
@@ -135,7 +497,7 @@ class RationaleZahl:
 
     def __rsub__(self, other):
         """Umgekehrte Subtraktion."""
-        return (-self) + other
+        return RationaleZahl._aus(other) - self
 
     def __rmul__(self, other):
         """Kommutation der Multiplikation."""
@@ -143,4 +505,7 @@ class RationaleZahl:
 
     def __rtruediv__(self, other):
         """Reziproke Division."""
-        return RationaleZahl(other) / self
+        return RationaleZahl._aus(other) / self
+
+
+numbers.Rational.register(RationaleZahl)
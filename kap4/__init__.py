@@ -27,10 +27,17 @@
 
 from .ggt import ggt, ggt_wechselwegnahme, ggt_rueckwaerts  # noqa: F401
 from .ggt import ggt_vorwaerts  # noqa: F401
+from .ggt import ggt_binaer, ggt_lehmer, ggt_auto, ggt_hgcd  # noqa: F401
+from .ggt_batch import produktbaum, batch_ggt, ggt_many  # noqa: F401
+from .modular import modinv, crt, crt_baum, modinv_batch  # noqa: F401
 
 from .regula_falsi import regula_falsi  # noqa: F401
 
 from .rational import zifferndarstellung, dezimaldarstellung  # noqa: F401
 from .rational import summendarstellung, bruchdarstellung  # noqa: F401
+from .rational import rational_sum, rational_prod  # noqa: F401
+from .rational import periodenlaenge, ziffern, periode_brent  # noqa: F401
+from .rational import ziffern_schreiben  # noqa: F401
 
 from .RationaleZahl import RationaleZahl  # noqa: F401
+from .RationaleMatrix import RationaleMatrix  # noqa: F401
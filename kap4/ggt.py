@@ -25,6 +25,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import math
+import operator
+
 
 def ggt(a, b):
     """Sucht den groessten gemeinsamen Teiler zweier
@@ -34,6 +37,18 @@ def ggt(a, b):
     :param b: Ganzzahl.
     :return: Groesster Gemeinsamer Teiler von a und b.
     """
+    import tools
+    if tools.is_intermediate_values:
+        # Protokollierende Variante, damit die Schleife unten
+        # ohne Abfrage je Schritt auskommt
+        tools.intermediate_values = [(a, b)]
+        schritte = tools.intermediate_values
+        n, m = a, b
+        while m != 0:
+            n, m = m, n % m
+            schritte.append((n, m))
+        return n
+
     n, m, l = a, b, b
     while l != 0:
         k, l = divmod(n, m)
@@ -49,6 +64,11 @@ def ggt_wechselwegnahme(a, b):
     :param b: Positive Ganzzahl.
     :return: Groesster Gemeinsamer Teiler von a und b.
     """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+
     if a == 0:
         return b
     if b == 0:
@@ -58,6 +78,8 @@ def ggt_wechselwegnahme(a, b):
             a = a - b
         else:
             b = b - a
+        if protokoll:
+            tools.intermediate_values.append((a, b))
     return a
 
 
@@ -71,10 +93,17 @@ def ggt_rueckwaerts(a, b):
     :param b: Positive Ganzzahl.
     :return: Tuple (ggt, m, n).
     """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+
     r = []
     while b != 0:
-        r = r + [a // b]
+        r.append(a // b)
         a, b = b, a - r[-1] * b
+        if protokoll:
+            tools.intermediate_values.append((a, b))
     m, n = 1, 0
     for q in reversed(r):
         m, n = n, m - q * n
@@ -91,11 +120,232 @@ def ggt_vorwaerts(a, b):
     :param b: Positive Ganzzahl.
     :return: Tuple (ggt, m, n).
     """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+        schritte = tools.intermediate_values
+
     new_m, m = (0, 1)
     new_n, n = (1, 0)
+    if protokoll:
+        # Protokollierende Variante, siehe ggt()
+        while b != 0:
+            r = a // b
+            a, b = b, a - r * b
+            new_m, m = m - r * new_m, new_m
+            new_n, n = n - r * new_n, new_n
+            schritte.append((a, b))
+        return (a, m, n)
     while b != 0:
         r = a // b
         a, b = b, a - r * b
         new_m, m = m - r * new_m, new_m
         new_n, n = n - r * new_n, new_n
     return (a, m, n)
+
+
+def ggt_binaer(a, b):
+    """Sucht den groessten gemeinsamen Teiler zweier
+    Zahlen mittels des binaeren Algorithmus von Stein, der
+    nur Subtraktionen und Bitverschiebungen verwendet.
+
+    :param a: Ganzzahl.
+    :param b: Ganzzahl.
+    :return: Groesster Gemeinsamer Teiler von a und b.
+    """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+    # Gemeinsame Zweierpotenz abspalten
+    k = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    if protokoll:
+        # Protokollierende Variante, siehe ggt()
+        while b != 0:
+            b >>= (b & -b).bit_length() - 1
+            if a > b:
+                a, b = b, a
+            b -= a
+            tools.intermediate_values.append((a, b))
+        return a << k
+    while b != 0:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << k
+
+
+def ggt_lehmer(a, b, W=64):
+    """Sucht den groessten gemeinsamen Teiler zweier
+    Zahlen mittels des Algorithmus von Lehmer.
+
+    Die Quotienten des Euklid'schen Algorithmus werden
+    anhand der fuehrenden W Bits von a und b bestimmt, solange
+    sie eindeutig sind, und erst dann gesammelt als 2x2-Matrix
+    auf die grossen Zahlen angewandt.
+
+    :param a: Ganzzahl.
+    :param b: Ganzzahl.
+    :param W: Anzahl fuehrender Bits je Schritt.
+    :return: Groesster Gemeinsamer Teiler von a und b.
+    """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+    while b >> W:
+        n = a.bit_length() - W
+        x, y = a >> n, b >> n
+        A, B, C, D = 1, 0, 0, 1
+        while y + C != 0 and y + D != 0:
+            q = (x + A) // (y + C)
+            if q != (x + B) // (y + D):
+                break
+            A, B, x, C, D, y = C, D, y, A - q * C, B - q * D, x - q * y
+        if B == 0:
+            a, b = b, a % b
+        else:
+            a, b = A * a + B * b, C * a + D * b
+        if protokoll:
+            tools.intermediate_values.append((a, b))
+    if protokoll:
+        schritte = tools.intermediate_values
+        g = ggt(a, b)
+        tools.intermediate_values = schritte + tools.intermediate_values[1:]
+        return g
+    return ggt(a, b)
+
+
+def ggt_auto(a, b):
+    """Sucht den groessten gemeinsamen Teiler zweier Zahlen
+    mit dem schnellsten verfuegbaren Verfahren.
+
+    Ganzzahlige Typen werden mittels operator.index() in int
+    umgewandelt und an math.gcd uebergeben, das fuer alle
+    Groessen schneller ist als ggt(), ggt_binaer() oder
+    ggt_lehmer().
+
+    :param a: Ganzzahl.
+    :param b: Ganzzahl.
+    :return: Groesster Gemeinsamer Teiler von a und b (>= 0).
+    """
+    return math.gcd(operator.index(a), operator.index(b))
+
+
+# Unterhalb dieser Bitlaenge arbeitet das Half-GCD-Verfahren
+# mit dem gewoehnlichen Euklid'schen Algorithmus
+_hgcd_grenze = 2048
+
+
+def _matrix_anwenden(a, b, M, P):
+    """Wendet die Matrix P auf (a, b) an, normiert das Ergebnis
+    auf a >= b >= 0 und liefert es zusammen mit dem Produkt
+    P * M zurueck."""
+    (p, q, r, s), (A, B, C, D) = P, M
+    a, b = p * a + q * b, r * a + s * b
+    A, B, C, D = p * A + q * C, p * B + q * D, r * A + s * C, r * B + s * D
+    if a < 0:
+        a, A, B = -a, -A, -B
+    if b < 0:
+        b, C, D = -b, -C, -D
+    if a < b:
+        a, b, A, B, C, D = b, a, C, D, A, B
+    return a, b, (A, B, C, D)
+
+
+def _hgcd(a, b):
+    """Bestimmt fuer a >= b >= 0 eine unimodulare Matrix
+    (A, B, C, D), sodass a' = A * a + B * b und b' = C * a + D * b
+    mit a' >= b' >= 0 und b' < 2^(n/2 + 1) gilt, wobei n die
+    Bitlaenge von a ist.
+
+    Die Matrix wird rekursiv aus den fuehrenden Bits von a und
+    b bestimmt: Ein erster Aufruf auf der oberen Haelfte
+    reduziert (a, b) auf etwa 3n/4 Bits, nach einem Euklid-
+    Schritt ein zweiter auf den fuehrenden Bits des Ergebnisses
+    auf etwa n/2 Bits.
+    Verbleibende Abweichungen werden mit einzelnen Euklid-
+    Schritten ausgeglichen.
+    """
+    n = a.bit_length()
+    s = n // 2 + 1
+    M = (1, 0, 0, 1)
+    if b.bit_length() <= s:
+        return M
+    if n > _hgcd_grenze:
+        a, b, M = _matrix_anwenden(a, b, M, _hgcd(a >> s, b >> s))
+        if b.bit_length() > s:
+            q = a // b
+            a, b, M = _matrix_anwenden(a, b, M, (0, 1, 1, -q))
+        k = 2 * s - a.bit_length()
+        if b.bit_length() > s and k > 0:
+            a, b, M = _matrix_anwenden(a, b, M, _hgcd(a >> k, b >> k))
+    while b.bit_length() > s:
+        q, r = divmod(a, b)
+        a, b, M = _matrix_anwenden(a, b, M, (0, 1, 1, -q))
+    return M
+
+
+def ggt_hgcd(a, b):
+    """Sucht den groesten gemeinsamen Teiler zweier
+    Zahlen sowie die entsprechenden Faktoren mittels des
+    Half-GCD-Verfahrens nach Schoenhage, sodass
+    m * a + n * b = ggt(a, b)
+
+    Das Verfahren reduziert die Zahlen rekursiv mit Matrizen,
+    die aus den fuehrenden Bits bestimmt werden, und ist fuer
+    grosse Zahlen subquadratisch. Die Faktoren werden wie bei
+    ggt_vorwaerts() betragsminimal gewaehlt.
+
+    :param a: Positive Ganzzahl.
+    :param b: Positive Ganzzahl.
+    :return: Tuple (ggt, m, n).
+    """
+    import tools
+    protokoll = tools.is_intermediate_values
+    if protokoll:
+        tools.intermediate_values = [(a, b)]
+
+    a0, b0 = a, b
+    tausch = a < b
+    if tausch:
+        a, b = b, a
+    M = (1, 0, 0, 1)
+    while b.bit_length() > _hgcd_grenze:
+        P = _hgcd(a, b)
+        if P == (1, 0, 0, 1):
+            P = (0, 1, 1, -(a // b))
+        a, b, M = _matrix_anwenden(a, b, M, P)
+        if protokoll:
+            tools.intermediate_values.append((a, b))
+    if protokoll:
+        schritte = tools.intermediate_values
+        g, m, n = ggt_vorwaerts(a, b)
+        tools.intermediate_values = schritte + tools.intermediate_values[1:]
+    else:
+        g, m, n = ggt_vorwaerts(a, b)
+    A, B, C, D = M
+    m, n = m * A + n * C, m * B + n * D
+    if tausch:
+        m, n = n, m
+    if g != 0 and b0 // g > 1:
+        # Betragsminimale Loesung m + t * b0 / g
+        k = b0 // g
+        m = m % k
+        if 2 * m > k:
+            m -= k
+        n = (g - m * a0) // b0
+    return (g, m, n)
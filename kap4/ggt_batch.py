@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+
+from .ggt import ggt_auto
+
+# Bis zu dieser Bitlaenge des Quotienten wird divmod() verwendet
+_div_grenze = 4000
+
+
+def _div2n1n(a, b, n):
+    """Dividiert a < 2^n * b durch b mit genau n Bits rekursiv
+    nach Burnikel und Ziegler und liefert (q, r)."""
+    if a.bit_length() - n <= _div_grenze:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a, b, n = a << 1, b << 1, n + 1
+    h = n >> 1
+    maske = (1 << h) - 1
+    b1, b2 = b >> h, b & maske
+    q1, r = _div3n2n(a >> n, (a >> h) & maske, b, b1, b2, h)
+    q2, r = _div3n2n(r, a & maske, b, b1, b2, h)
+    return q1 << h | q2, r >> pad
+
+
+def _div3n2n(a12, a3, b, b1, b2, n):
+    """Hilfsschritt von _div2n1n(): dividiert (a12, a3) durch
+    b = (b1, b2) mit Bloecken der Laenge n."""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q, r = q - 1, r + b
+    return q, r
+
+
+def _rest(a, b):
+    """Liefert a mod b fuer a >= 0, b > 0.
+
+    Fuer grosse Zahlen wird a in Bloecke der Bitlaenge von b
+    zerlegt und blockweise rekursiv dividiert, sodass der
+    Aufwand nicht quadratisch in der Laenge von a waechst.
+    """
+    n = b.bit_length()
+    if a.bit_length() - n <= _div_grenze:
+        return a % b
+    bloecke = []
+    while a:
+        bloecke.append(a & ((1 << n) - 1))
+        a >>= n
+    r = 0
+    for block in reversed(bloecke):
+        r = _div2n1n((r << n) | block, b, n)[1]
+    return r
+
+
+def produktbaum(zahlen):
+    """Erstellt den Produktbaum einer Folge von Zahlen.
+
+    Ebene 0 enthaelt die Zahlen selbst, jede weitere Ebene
+    die Produkte benachbarter Paare der vorherigen Ebene
+    (ein uebrig bleibendes Element wird uebernommen), die
+    letzte Ebene nur noch das Produkt aller Zahlen.
+
+    :param zahlen: Iterierbare Folge von Zahlen.
+    :return: Liste der Ebenen als Listen.
+    """
+    baum = [list(zahlen)]
+    while len(baum[-1]) > 1:
+        e = baum[-1]
+        rest = [e[-1]] if len(e) % 2 else []
+        baum.append([e[i] * e[i + 1] for i in range(0, len(e) - 1, 2)] +
+                    rest)
+    return baum
+
+
+def batch_ggt(zahlen):
+    """Ermittelt fuer jede Zahl x_i einer Folge positiver
+    Ganzzahlen den groessten gemeinsamen Teiler mit dem
+    Produkt aller anderen Zahlen (Verfahren von Bernstein).
+
+    Aus dem Produktbaum wird ein Restbaum berechnet, in dem
+    jeder Knoten den Rest des Produkts P aller Zahlen modulo
+    dem Quadrat seines Produkts enthaelt. Fuer ein Blatt x_i
+    ist dann ggt(x_i, P / x_i) = ggt(x_i, (P mod x_i^2) / x_i).
+    Der Aufwand ist quasi-linear in der Gesamtlaenge der Zahlen.
+
+    :param zahlen: Iterierbare Folge positiver Ganzzahlen.
+    :return: Liste der groessten gemeinsamen Teiler.
+    """
+    baum = produktbaum(zahlen)
+    reste = baum[-1]
+    for ebene in reversed(baum):
+        reste = [_rest(reste[i // 2], x * x) for i, x in enumerate(ebene)]
+    return [ggt_auto(r // x, x) for r, x in zip(reste, baum[0])]
+
+
+def _ggt_reduzieren(zahlen):
+    """Bestimmt den ggT einer Folge, bricht bei 1 ab."""
+    g = 0
+    for x in zahlen:
+        g = ggt_auto(g, x)
+        if g == 1:
+            break
+    return g
+
+
+def ggt_many(zahlen, prozesse=None):
+    """Ermittelt den groessten gemeinsamen Teiler aller Zahlen
+    einer Folge.
+
+    Sobald der ggT 1 erreicht, wird die Berechnung abgebrochen.
+    Optional wird die Folge in Teilstuecke zerlegt, deren ggT
+    parallel in mehreren Prozessen bestimmt wird.
+
+    :param zahlen: Iterierbare Folge von Ganzzahlen.
+    :param prozesse: Anzahl Prozesse (optional, Standard: 1).
+    :return: Groesster gemeinsamer Teiler (0 fuer leere Folge).
+    """
+    if prozesse is None or prozesse <= 1:
+        return _ggt_reduzieren(zahlen)
+    zahlen = list(zahlen)
+    laenge = -(-len(zahlen) // prozesse)
+    stuecke = [zahlen[i:i + laenge] for i in range(0, len(zahlen), laenge)]
+    with multiprocessing.Pool(prozesse) as pool:
+        return _ggt_reduzieren(pool.map(_ggt_reduzieren, stuecke))
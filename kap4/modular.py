@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+
+# This file belongs to the collection of Python codes from the book
+#
+#   "Mit Mathe richtig anfangen - Eine Einfuehrung mit integrierter Anwendung
+#    der Programmiersprache Python"
+#
+# by Peter Knabner, Balthasar Reuter, and Raphael Schulz.
+# Published by Springer-Spektrum, 2019.
+#
+# If you want to use this code please include a reference to this publication.
+#
+# Copyright (C) 2019 Peter Knabner, Balthasar Reuter, Raphael Schulz.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from .ggt import ggt_vorwaerts, ggt_hgcd, _hgcd_grenze
+from .ggt_batch import produktbaum, _rest
+
+
+def _ggt_erweitert(a, b):
+    """Erweiterter Euklid'scher Algorithmus, fuer grosse Zahlen
+    mittels ggt_hgcd()."""
+    if max(a, b).bit_length() > _hgcd_grenze:
+        return ggt_hgcd(a, b)
+    return ggt_vorwaerts(a, b)
+
+
+def modinv(a, m):
+    """Berechnet das multiplikative Inverse von a modulo m
+    mit dem erweiterten Euklid'schen Algorithmus.
+
+    :param a: Ganzzahl.
+    :param m: Modul, m >= 1.
+    :return: Zahl 0 <= x < m mit a * x = 1 modulo m.
+    """
+    g, x, _ = _ggt_erweitert(a % m, m)
+    if g != 1 and m != 1:
+        raise ValueError("a ist modulo m nicht invertierbar")
+    return x % m
+
+
+def crt(reste, moduln):
+    """Loest das System von Kongruenzen x = r_i modulo m_i
+    (Chinesischer Restsatz).
+
+    Die Kongruenzen werden nacheinander kombiniert; die Moduln
+    muessen nicht teilerfremd sein.
+
+    :param reste: Folge der Reste r_i.
+    :param moduln: Folge der Moduln m_i >= 1.
+    :return: Tupel (x, M) mit 0 <= x < M, wobei M das kleinste
+             gemeinsame Vielfache der Moduln ist.
+    """
+    x, M = 0, 1
+    for r, m in zip(reste, moduln):
+        g, u, _ = _ggt_erweitert(M, m)
+        if (r - x) % g != 0:
+            raise ValueError("Kongruenzen sind nicht loesbar")
+        # x + M * t = r (mod m)  <=>  t = u * (r - x) / g (mod m / g)
+        t = u * ((r - x) // g) % (m // g)
+        x, M = x + M * t, M * (m // g)
+        x %= M
+    return x, M
+
+
+def crt_baum(reste, moduln):
+    """Loest das System von Kongruenzen x = r_i modulo m_i fuer
+    paarweise teilerfremde Moduln mittels Produktbaum.
+
+    Mit M = m_1 * ... * m_k ist x = Summe von
+    r_i * c_i * M / m_i, wobei c_i das Inverse von M / m_i
+    modulo m_i ist. Die Werte (M / m_i) mod m_i ergeben sich
+    wie bei batch_ggt() aus einem Restbaum, die Summe wird
+    anschliessend paarweise entlang des Produktbaums gebildet.
+
+    :param reste: Folge der Reste r_i.
+    :param moduln: Folge paarweise teilerfremder Moduln m_i >= 1.
+    :return: Tupel (x, M) mit 0 <= x < M = m_1 * ... * m_k.
+    """
+    baum = produktbaum(moduln)
+    M = baum[-1][0] if baum[0] else 1
+    # (M / m_i) mod m_i = (M mod m_i^2) / m_i
+    reste_baum = baum[-1]
+    for ebene in reversed(baum):
+        reste_baum = [_rest(reste_baum[i // 2], x * x)
+                      for i, x in enumerate(ebene)]
+    werte = [r * modinv(s // m, m) % m
+             for r, s, m in zip(reste, reste_baum, baum[0])]
+    # Aufsteigen: Knoten (L, R) liefert w_L * M_R + w_R * M_L
+    for ebene in baum[:-1]:
+        neu = [werte[i] * ebene[i + 1] + werte[i + 1] * ebene[i]
+               for i in range(0, len(ebene) - 1, 2)]
+        if len(ebene) % 2:
+            neu.append(werte[-1])
+        werte = neu
+    return (werte[0] % M if werte else 0), M
+
+
+def modinv_batch(werte, m):
+    """Invertiert mehrere Zahlen modulo m mit dem Verfahren von
+    Montgomery, das nur ein einziges Inverses berechnet.
+
+    Aus den Praefixprodukten p_i = a_1 * ... * a_i wird
+    p_n^(-1) bestimmt und rueckwaerts mittels
+    a_i^(-1) = p_(i-1) * p_i^(-1), p_(i-1)^(-1) = a_i * p_i^(-1)
+    aufgeloest. Insgesamt werden 3(n - 1) Multiplikationen und
+    ein erweiterter Euklid'scher Algorithmus benoetigt.
+
+    :param werte: Folge von modulo m invertierbaren Zahlen.
+    :param m: Modul, m >= 1.
+    :return: Liste der Inversen modulo m.
+    """
+    werte = [a % m for a in werte]
+    if not werte:
+        return []
+    praefix = [werte[0]]
+    for a in werte[1:]:
+        praefix.append(praefix[-1] * a % m)
+    inv = modinv(praefix[-1], m)
+    inverse = len(werte) * [0]
+    for i in range(len(werte) - 1, 0, -1):
+        inverse[i] = praefix[i - 1] * inv % m
+        inv = inv * werte[i] % m
+    inverse[0] = inv
+    return inverse
@@ -25,7 +25,53 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import math
+import time
 from fractions import Fraction
+from itertools import chain
+
+from .RationaleZahl import RationaleZahl
+
+
+# Bis zu dieser Groesse des Nenners bestimmt zifferndarstellung()
+# die Periode durch Merken der Reste, darueber direkt
+_perioden_grenze = 1 << 10
+
+
+def periodenlaenge(q, p=10):
+    """Bestimmt Vorperioden- und Periodenlaenge der Ziffern-
+    darstellung des gebrochenen Anteils einer rationalen Zahl
+    zur Basis p, ohne die Ziffern zu berechnen.
+
+    Der Nenner n wird in einen Anteil n1, der nur Primfaktoren
+    von p enthaelt, und einen zu p teilerfremden Anteil n2
+    zerlegt. Die Vorperiodenlaenge ist das kleinste k mit
+    n1 | p^k, die Periodenlaenge die Ordnung von p modulo n2.
+
+    :param q: rationale Zahl (Fraction, RationaleZahl oder int).
+    :param p: Basis fuer die Zifferndarstellung.
+    :return: Tupel (k, l) mit Vorperiodenlaenge k und
+             Periodenlaenge l.
+    """
+    from collections import Counter
+    from kap3 import faktorisierung
+
+    n, k = q.denominator, 0
+    g = math.gcd(n, p)
+    while g > 1:
+        n, k = n // g, k + 1
+        g = math.gcd(n, p)
+
+    # Carmichael-Funktion von n als Vielfaches der Ordnung
+    lam = 1
+    for r, e in Counter(faktorisierung(n)).items():
+        phi = (r - 1) * r ** (e - 1)
+        lam = math.lcm(lam, phi // 2 if r == 2 and e >= 3 else phi)
+    l = lam
+    for r in Counter(faktorisierung(lam)):
+        while l % r == 0 and pow(p, l // r, n) == 1:
+            l //= r
+    return k, l
 
 
 def zifferndarstellung(q, p=10):
@@ -33,6 +79,11 @@ def zifferndarstellung(q, p=10):
     0 < q < 1 in die periodische Zifferndarstellung zu einer
     beliebigen Basis p um.
 
+    Die Ziffern entstehen durch Division mit Rest auf dem
+    ganzzahligen Zaehler. Fuer kleine Nenner wird die Periode
+    durch Merken der Reste erkannt, fuer grosse werden Vor-
+    periode und Periode vorab mit periodenlaenge() bestimmt.
+
     :param q: rationale Zahl 0 < q < 1.
     :param p: Basis fuer die Zifferndarstellung.
     :return (Q, k): Tupel mit Liste Q der Ziffern und
@@ -41,34 +92,204 @@ def zifferndarstellung(q, p=10):
     if not isinstance(q, Fraction):
         raise TypeError
 
-    Q, P, restbrueche = [], 1, []
-    while not q * P in restbrueche:
-        restbrueche += [q * P]
-        P *= p
-        Q += [(q.numerator * P) // q.denominator]
-        q -= Fraction(Q[-1], P)
-    return Q, restbrueche.index(q * P)
+    x, n = q.numerator, q.denominator
+    Q = []
+    if n <= _perioden_grenze:
+        reste = {}
+        while x not in reste:
+            reste[x] = len(Q)
+            d, x = divmod(p * x, n)
+            Q.append(d)
+        return Q, reste[x]
+
+    k, l = periodenlaenge(q, p)
+    # Ein Startrest ausserhalb [0, n) wiederholt sich nicht
+    if not 0 <= x < n:
+        k = max(k, 1)
+    for _ in range(k + l):
+        d, x = divmod(p * x, n)
+        Q.append(d)
+    return Q, k
+
+
+def ziffern(q, p=10):
+    """Erzeugt die Ziffern der Darstellung einer rationalen Zahl
+    zur Basis p fortlaufend durch ganzzahlige Division mit Rest.
+
+    Die Ziffern stimmen mit denen von zifferndarstellung() ueberein,
+    werden aber ohne Ende und mit konstantem Speicher erzeugt.
+
+    :param q: rationale Zahl (Fraction, RationaleZahl oder int).
+    :param p: Basis fuer die Zifferndarstellung.
+    :return: Generator der Ziffern.
+    """
+    x, n = q.numerator, q.denominator
+    while True:
+        d, x = divmod(p * x, n)
+        yield d
+
+
+def periode_brent(q, p=10):
+    """Bestimmt Vorperioden- und Periodenlaenge der Ziffern-
+    darstellung zur Basis p mit dem Zyklensuchverfahren von
+    Brent auf den Resten der Division mit konstantem Speicher.
+
+    Die Laufzeit ist linear in der Summe beider Laengen; fuer
+    grosse Nenner ist periodenlaenge() schneller.
+
+    :param q: rationale Zahl (Fraction, RationaleZahl oder int).
+    :param p: Basis fuer die Zifferndarstellung.
+    :return: Tupel (k, l) mit Vorperiodenlaenge k und
+             Periodenlaenge l wie bei zifferndarstellung().
+    """
+    x0, n = q.numerator, q.denominator
+
+    # Periodenlaenge l: Der Hase laeuft in Abschnitten doppelter
+    # Laenge, die Schildkroete wartet am Anfang jedes Abschnitts
+    potenz, l = 1, 1
+    schildkroete, hase = x0, p * x0 % n
+    while schildkroete != hase:
+        if potenz == l:
+            schildkroete, potenz, l = hase, 2 * potenz, 0
+        hase = p * hase % n
+        l += 1
+
+    # Vorperiode k: Zwei Zeiger im Abstand l treffen sich am
+    # Beginn der Periode
+    schildkroete, hase, k = x0, x0 * pow(p, l, n) % n, 0
+    while schildkroete != hase:
+        schildkroete, hase, k = p * schildkroete % n, p * hase % n, k + 1
+    return k, l
+
+
+# Zeichen fuer Ziffern bis zur Basis 36
+_zeichen = '0123456789abcdefghijklmnopqrstuvwxyz'
+
 
+def _block_text(wert, p, b):
+    """Wandelt einen Block 0 <= wert < p^b in b Zeichen zur
+    Basis p."""
+    if p == 10:
+        return '{:0{}d}'.format(wert, b)
+    z = b * ['0']
+    for i in range(b - 1, -1, -1):
+        wert, d = divmod(wert, p)
+        z[i] = _zeichen[d]
+    return ''.join(z)
 
-def dezimaldarstellung(q):
+
+def _bloecke(x, n, p, b):
+    """Erzeugt ausgehend vom Rest x der Division durch n
+    fortlaufend Bloecke von je b Ziffern zur Basis p als
+    Ganzzahlen 0 <= block < p^b."""
+    pb = p ** b
+    while True:
+        block, x = divmod(pb * x, n)
+        yield block
+
+
+def ziffern_schreiben(q, ziel, p=10, anzahl=None, puffer=1 << 16):
+    """Schreibt die Ziffern einer rationalen Zahl 0 <= q < 1 zur
+    Basis p blockweise als Text in eine Datei oder einen Puffer.
+
+    Je Divisionsschritt werden so viele Ziffern gebildet, wie in
+    ein 64-Bit-Wort passen (19 im Dezimalsystem), und jeweils
+    'puffer' Ziffern auf einmal geschrieben, sodass der Speicher-
+    bedarf unabhaengig von der Anzahl der Ziffern ist.
+
+    :param q: rationale Zahl 0 <= q < 1.
+    :param ziel: Objekt mit Methode write(), z.B. eine Textdatei
+                 oder io.StringIO.
+    :param p: Basis 2 <= p <= 36.
+    :param anzahl: Anzahl der zu schreibenden Ziffern; ohne Angabe
+                   Vorperiode und eine Periode (siehe periodenlaenge()).
+    :param puffer: Anzahl der Ziffern je Schreibvorgang.
+    :return: Tupel (k, l) mit Vorperioden- und Periodenlaenge, falls
+             anzahl nicht angegeben ist, sonst die Anzahl.
+    """
+    if not 0 <= q < 1:
+        raise ValueError("q muss in [0, 1) liegen")
+    if not 2 <= p <= len(_zeichen):
+        raise ValueError("Basis muss zwischen 2 und 36 liegen")
+    ergebnis = anzahl
+    if anzahl is None:
+        ergebnis = periodenlaenge(q, p)
+        anzahl = sum(ergebnis)
+
+    # b Ziffern je Block, b maximal mit p^b < 2^64
+    b = 1
+    while p ** (b + 1) < 1 << 64:
+        b += 1
+    je_puffer = max(1, puffer // b)
+    bloecke = _bloecke(q.numerator, q.denominator, p, b)
+    while anzahl > 0:
+        k = min(je_puffer, -(-anzahl // b))
+        text = ''.join([_block_text(next(bloecke), p, b) for _ in range(k)])
+        ziel.write(text[:anzahl])
+        anzahl -= len(text)
+    return ergebnis
+
+
+# Anzahl Dezimalziffern, die dezimaldarstellung() je
+# Divisionsschritt bildet
+_dezimal_block = 18
+
+
+def dezimaldarstellung(q, max_digits=None, zeitbudget=None):
     """Wandelt eine als fractions.Fraction gegebene Zahl
     0 < q < 1 in Dezimaldarstellung um.
 
-    Beachte: Fuer Zahlen mit periodischer Dezimaldarstellung
-    terminiert dieses Verfahren nicht!
+    Die Ziffern entstehen durch ganzzahlige Division mit Rest,
+    wobei je Schritt ein Block von 18 Ziffern zur Basis 10^18
+    gebildet wird. Periodische Darstellungen werden am Nenner
+    erkannt; fuer sie muss max_digits oder zeitbudget angegeben
+    werden.
 
     :param q: rationale Zahl 0 < q < 1.
+    :param max_digits: Hoechstzahl zu berechnender Ziffern.
+    :param zeitbudget: Maximale Rechenzeit in Sekunden, nach der
+                       die bis dahin berechneten Ziffern geliefert
+                       werden.
     :return: Liste mit Ziffern [n_1, n_2, ...].
     """
     if not isinstance(q, Fraction):
         raise TypeError
 
-    Q, J = [], 10
-    while q != 0:
-        Q += [int(q * J)]
-        q -= Fraction(Q[-1], J)
-        J *= 10
-    return Q
+    a, n = q.numerator, q.denominator
+    if a == 0:
+        return []
+
+    # Abbrechende Darstellung genau dann, wenn n = 2^e2 * 5^e5;
+    # sie hat dann max(e2, e5) Ziffern
+    e2 = (n & -n).bit_length() - 1
+    m, e5 = n >> e2, 0
+    while m % 5 == 0:
+        m, e5 = m // 5, e5 + 1
+    anzahl = max(e2, e5, 1) if m == 1 else None
+    if max_digits is not None:
+        anzahl = max_digits if anzahl is None else min(anzahl, max_digits)
+    if anzahl is None and zeitbudget is None:
+        raise ValueError("periodische Dezimaldarstellung, "
+                         "max_digits oder zeitbudget angeben")
+    if anzahl == 0:
+        return []
+
+    # Die erste Ziffer kann bei q >= 1 mehrstellig sein; fuer
+    # q < 0 werden wie bisher die Ziffern von |q| negiert
+    s = -1 if a < 0 else 1
+    Q = [0]
+    Q[0], x = divmod(10 * abs(a), n)
+    ende = None if zeitbudget is None else time.perf_counter() + zeitbudget
+    b = _dezimal_block
+    for block in _bloecke(x, n, 10, b):
+        if anzahl is not None and len(Q) >= anzahl:
+            break
+        if ende is not None and time.perf_counter() > ende:
+            break
+        Q += map(int, '{:0{}d}'.format(block, b))
+    if anzahl is not None:
+        del Q[anzahl:]
+    return [s * d for d in Q] if s < 0 else Q
 
 
 def summendarstellung(q):
@@ -111,3 +332,85 @@ def bruchdarstellung(Q, k, p=10):
     l = len(Q) - k
     q = Fraction(a * (p**l - 1) + t, p**k * (p**l - 1))
     return q
+
+
+def _zaehler_nenner(werte):
+    """Zerlegt Ganzzahlen, Gleitkommazahlen, Brueche und rationale
+    Zahlen in Paare (Zaehler, Nenner) und stellt fest, ob eine
+    rationale Zahl darunter war."""
+    paare, rational = [], False
+    for x in werte:
+        if isinstance(x, RationaleZahl):
+            rational = True
+        if isinstance(x, float):
+            paare.append(x.as_integer_ratio())
+        else:
+            paare.append((x.numerator, x.denominator))
+    return paare, rational
+
+
+def _paarweise(paare, verknuepfen):
+    """Verknuepft die Paare entlang eines balancierten Binaerbaums,
+    sodass die Operanden jeder Ebene etwa gleich gross sind."""
+    while len(paare) > 1:
+        neu = [verknuepfen(paare[i], paare[i + 1])
+               for i in range(0, len(paare) - 1, 2)]
+        if len(paare) % 2:
+            neu.append(paare[-1])
+        paare = neu
+    return paare[0]
+
+
+def _ergebnis(m, n, rational):
+    """Kuerzt m/n einmalig und liefert das Ergebnis als
+    RationaleZahl oder fractions.Fraction."""
+    q = RationaleZahl(m, n)
+    return q if rational else q.als_fraction()
+
+
+def _addieren(x, y):
+    """Addiert zwei ungekuerzte Brueche (a, b) und (c, d)."""
+    (a, b), (c, d) = x, y
+    if b == d:
+        return (a + c, b)
+    return (a * d + c * b, b * d)
+
+
+def rational_sum(werte, start=0):
+    """Summiert rationale Zahlen paarweise entlang eines
+    balancierten Binaerbaums (binary splitting).
+
+    Beim Summieren von links nach rechts wachsen die Nenner der
+    Zwischensummen mit jedem Summanden, sodass jede Addition mit
+    einer grossen Zahl rechnet. Im Binaerbaum werden dagegen nur
+    etwa gleich grosse Zaehler und Nenner multipliziert, und
+    gekuerzt wird nur einmal am Ende.
+
+    :param werte: Iterierbare Folge von Ganzzahlen, Gleitkomma-
+                  zahlen, Bruechen vom Typ Fraction oder rationalen
+                  Zahlen.
+    :param start: Startwert, der zur Summe addiert wird (wie bei
+                  sum()); fuer eine leere Folge das Ergebnis.
+    :return: Summe als RationaleZahl, falls start oder einer der
+             Summanden eine rationale Zahl ist, sonst als Fraction.
+    """
+    paare, rational = _zaehler_nenner(chain((start,), werte))
+    return _ergebnis(*_paarweise(paare, _addieren), rational)
+
+
+def rational_prod(werte, start=1):
+    """Multipliziert rationale Zahlen paarweise entlang eines
+    balancierten Binaerbaums und kuerzt nur einmal am Ende.
+
+    :param werte: Iterierbare Folge von Ganzzahlen, Gleitkomma-
+                  zahlen, Bruechen vom Typ Fraction oder rationalen
+                  Zahlen.
+    :param start: Startwert, mit dem das Produkt multipliziert wird
+                  (wie bei math.prod()); fuer eine leere Folge das
+                  Ergebnis.
+    :return: Produkt als RationaleZahl, falls start oder einer der
+             Faktoren eine rationale Zahl ist, sonst als Fraction.
+    """
+    paare, rational = _zaehler_nenner(chain((start,), werte))
+    m, n = _paarweise(paare, lambda x, y: (x[0] * y[0], x[1] * y[1]))
+    return _ergebnis(m, n, rational)
@@ -47,6 +47,78 @@ class TestKap3(unittest.TestCase):
             k = random.randrange(20)
             self.assertEqual(nchoosek(n, k), binom(n, k))
 
+    def test_nchoosek_prim(self):
+        """Tests nchoosek_prim() with 10 random and some large numbers."""
+        from kap3 import nchoosek_prim
+        for _ in range(10):
+            n = random.randrange(20)
+            k = random.randrange(20)
+            self.assertEqual(nchoosek_prim(n, k), binom(n, k))
+        for _ in range(10):
+            n = random.randrange(10000)
+            k = random.randrange(n + 1)
+            self.assertEqual(nchoosek_prim(n, k), binom(n, k))
+
+    def test_nchoosek_mod(self):
+        """Tests nchoosek_mod() for prime, prime power and other moduli."""
+        from kap3 import nchoosek_mod
+        moduli = (1, 2, 7, 8, 9, 12, 97, 125, 360, 2**16, 3**7 * 5**3,
+                  10**9 + 7)
+        for _ in range(10):
+            n = random.randrange(5000)
+            k = random.randrange(n + 2)
+            for m in moduli:
+                self.assertEqual(nchoosek_mod(n, k, m), binom(n, k) % m)
+        # Satz von Lucas: 1000 ueber 10 modulo 3, Ziffern zur Basis 3
+        # 1101001 und 101, also (0 ueber 1) = 0
+        self.assertEqual(nchoosek_mod(1000, 10, 3), 0)
+        self.assertEqual(nchoosek_mod(10**20, 10**10, 2), 0)
+        # Die zwischengespeicherten Tabellen bleiben im Speicherlimit
+        from kap3 import binom as modul
+        alt = modul._tabellen_max_bytes
+        modul._tabellen_max_bytes = 8 * 250
+        try:
+            for m in (125, 49, 121, 125):
+                self.assertEqual(nchoosek_mod(1000, 10, m),
+                                 binom(1000, 10) % m)
+            self.assertEqual(list(modul._tabellen), [(11, 121), (5, 125)])
+        finally:
+            modul._tabellen_max_bytes = alt
+
+    def test_FakultaetsCache(self):
+        """Tests FakultaetsCache, exact and modulo a prime."""
+        from kap3 import FakultaetsCache, nchoosek, pascal_zeile
+        from math import factorial
+        for p in (None, 2, 7, 10**9 + 7):
+            for max_bytes in (1 << 20, 64):
+                cache = FakultaetsCache(p, max_bytes)
+                for _ in range(10):
+                    n = random.randrange(200)
+                    k = random.randrange(202)
+                    c = binom(n, k) if p is None else binom(n, k) % p
+                    self.assertEqual(nchoosek(n, k, cache), c)
+                    f = factorial(n) if p is None else factorial(n) % p
+                    self.assertEqual(cache.fakultaet(n), f)
+                n = random.randrange(50)
+                self.assertEqual(list(pascal_zeile(n, cache=cache)),
+                                 [nchoosek(n, k, cache)
+                                  for k in range(n + 1)])
+        cache = FakultaetsCache(max_bytes=1000)
+        cache.fakultaet(1000)
+        self.assertGreater(cache.schritt, 1)
+        self.assertLessEqual(cache._bytes, 1000)
+        self.assertRaises(ValueError, FakultaetsCache, 10)
+
+    def test_nchoosek_many(self):
+        """Tests nchoosek_many() with random pairs."""
+        from kap3 import nchoosek_many, FakultaetsCache
+        paare = [(random.randrange(100), random.randrange(100))
+                 for _ in range(50)]
+        self.assertEqual(nchoosek_many(paare),
+                         [binom(n, k) for n, k in paare])
+        self.assertEqual(nchoosek_many(iter(paare), FakultaetsCache(13)),
+                         [binom(n, k) % 13 for n, k in paare])
+
     def test_pascal(self):
         """Tests pascal() up to N = 20."""
         from kap3 import pascal
@@ -56,6 +128,51 @@ class TestKap3(unittest.TestCase):
             for k in range(n + 1):
                 self.assertEqual(p[n][k], binom(n, k))
 
+    def test_pascal_zeilen(self):
+        """Tests pascal_zeilen(), pascal_zeile() and pascal_diagonale()."""
+        from kap3 import pascal_zeilen, pascal_zeile, pascal_diagonale
+        N = 30
+        for m in (None, 2, 10, 10**9 + 7):
+            def mod(c):
+                return c if m is None else c % m
+            n = 0
+            for zeile in pascal_zeilen(N, m):
+                self.assertEqual(list(zeile), [mod(binom(n, k))
+                                               for k in range(n + 1)])
+                n += 1
+            self.assertEqual(n, N + 1)
+            for n in range(N + 1):
+                self.assertEqual(list(pascal_zeile(n, m)),
+                                 [mod(binom(n, k)) for k in range(n + 1)])
+            for k in range(N + 2):
+                self.assertEqual(list(pascal_diagonale(N, k, m)),
+                                 [mod(binom(n, k)) for n in range(k, N + 1)])
+        for m in (1, 12, 97, 360, 3**7 * 5**3):
+            n = random.randrange(300)
+            self.assertEqual(list(pascal_zeile(n, m)),
+                             [binom(n, k) % m for k in range(n + 1)])
+        self.assertRaises(ValueError, pascal_zeile, -1, 10)
+
+    def test_pascal_mod2(self):
+        """Tests pascal_mod2() and its statistics and image export."""
+        from kap3 import pascal_mod2, pascal_mod2_statistik, pascal_mod2_bild
+        N = 40
+        zeilen = list(pascal_mod2(N))
+        self.assertEqual(len(zeilen), N + 1)
+        for n, zeile in enumerate(zeilen):
+            for k in range(n + 2):
+                self.assertEqual((zeile >> k) & 1, binom(n, k) % 2
+                                 if k <= n else 0)
+        self.assertEqual(pascal_mod2_statistik(N),
+                         [2**bin(n).count('1') for n in range(N + 1)])
+        bild = pascal_mod2_bild(9)
+        kopf = b'P4\n10 10\n'
+        self.assertTrue(bild.startswith(kopf))
+        self.assertEqual(len(bild), len(kopf) + 10 * 2)
+        # Zeile 3: 1 1 1 1, Zeile 4: 1 0 0 0 1
+        self.assertEqual(bild[len(kopf) + 6:len(kopf) + 10],
+                         bytes([0b11110000, 0, 0b10001000, 0]))
+
     def test_erat(self):
         """Tests erat() with given list of primes."""
         from kap3 import erat
@@ -89,6 +206,20 @@ class TestKap3(unittest.TestCase):
             self.assertEqual(f, probediv(n))
             self.assertEqual(reduce(lambda x, y: x * y, f), n)
 
+    def test_fermat_gross(self):
+        """Tests fermat() and fermat_probediv() beyond 2^53."""
+        from kap3 import fermat, fermat_probediv, probediv
+        p, q = 2**61 - 1, 2**61 + 15
+        self.assertEqual(fermat(p * q), [p, q])
+        self.assertEqual(fermat(p * q, sieb=False), [p, q])
+        self.assertEqual(fermat(4 * p * q, sieb=True), [2, 2, p, q])
+        self.assertEqual(fermat_probediv(p * q), [p, q])
+        self.assertEqual(fermat_probediv(3 * 67108879 * 67108913),
+                         [3, 67108879, 67108913])
+        for n in range(1, 500):
+            self.assertEqual(fermat_probediv(n, sieb=True), probediv(n))
+            self.assertEqual(fermat_probediv(n, sieb=False), probediv(n))
+
     def test_fermat(self):
         """Tests fermat() with 10 random numbers."""
         from kap3 import fermat, probediv
@@ -98,3 +229,165 @@ class TestKap3(unittest.TestCase):
             f = fermat(n)
             self.assertEqual(f, probediv(n))
             self.assertEqual(reduce(lambda x, y: x * y, f), n)
+
+    def test_erat_segment(self):
+        """Tests erat_basis() and erat_segment() against erat()."""
+        from kap3 import erat, erat_basis, erat_segment
+        self.assertEqual(list(erat_basis(1000)), erat(1000))
+        self.assertEqual(list(erat_basis(1)), [])
+        for _ in range(10):
+            lo = random.randrange(2000)
+            hi = lo + random.randrange(2000)
+            primes = [p for p in erat(hi) if lo <= p < hi]
+            self.assertEqual(list(erat_segment(lo, hi)), primes)
+
+    def test_erat_parallel(self):
+        """Tests erat_parallel() with small segments."""
+        from kap3 import erat, erat_parallel
+        primes = [p for p in erat(20000) if p >= 100]
+        self.assertEqual(list(erat_parallel(100, 20001, 2, segment=997)),
+                         primes)
+        self.assertEqual(erat_parallel(100, 20001, 2, segment=997,
+                                       zaehlen=True), len(primes))
+        self.assertEqual(erat_parallel(10, 5, zaehlen=True), 0)
+        for hi in range(5):
+            self.assertEqual(list(erat_parallel(0, hi)),
+                             [p for p in (2, 3) if p < hi])
+            self.assertEqual(erat_parallel(0, hi, zaehlen=True),
+                             len([p for p in (2, 3) if p < hi]))
+
+    def test_PrimzahlTabelle(self):
+        """Tests growing, storing and loading a PrimzahlTabelle."""
+        from kap3 import erat, PrimzahlTabelle
+        import os
+        import tempfile
+        t = PrimzahlTabelle()
+        self.assertEqual(list(t.bis(100)), erat(100))
+        self.assertEqual(list(t.bis(5000)), erat(5000))
+        self.assertEqual(list(t.bis(50)), erat(50))
+        with tempfile.TemporaryDirectory() as d:
+            pfad = os.path.join(d, 'primzahlen.bin')
+            t.speichern(pfad)
+            u = PrimzahlTabelle()
+            u.laden(pfad)
+            self.assertEqual(u.grenze, t.grenze)
+            self.assertEqual(list(u.bis(5000)), erat(5000))
+            u.erweitern(3 * t.grenze)
+            self.assertEqual(list(u.bis(3 * t.grenze)), erat(3 * t.grenze))
+
+    def test_SPFTabelle(self):
+        """Tests SPFTabelle against probediv()."""
+        from kap3 import SPFTabelle, spf_sieb, probediv
+        self.assertEqual(list(spf_sieb(10)), [0, 0, 2, 3, 2, 5, 2, 7, 2, 3, 2])
+        self.assertEqual(list(spf_sieb(0)), [0])
+        t = SPFTabelle(5000)
+        for _ in range(10):
+            n = random.randrange(5001)
+            self.assertEqual(t.factor(n), probediv(n))
+        lo = random.randrange(4000)
+        self.assertEqual(list(t.factor_range(lo, lo + 1000)),
+                         [probediv(n) for n in range(lo, lo + 1000)])
+        self.assertRaises(ValueError, t.factor, 5001)
+
+    def test_is_prime(self):
+        """Tests is_prime() against erat() and with large numbers."""
+        from kap3 import erat, is_prime
+        primes = set(erat(10000))
+        for n in range(-5, 10001):
+            self.assertEqual(is_prime(n), n in primes)
+        # Carmichael-Zahl und starke Pseudoprimzahl zu 2, ..., 23
+        self.assertFalse(is_prime(561))
+        self.assertFalse(is_prime(3825123056546413051))
+        self.assertTrue(is_prime(2**61 - 1))
+        self.assertTrue(is_prime(2**89 - 1))
+        self.assertTrue(is_prime(2**127 - 1))
+        self.assertFalse(is_prime((2**61 - 1) * (2**89 - 1)))
+
+    def test_is_prime_many(self):
+        """Tests is_prime_many() against is_prime()."""
+        from kap3 import is_prime, is_prime_many
+        zahlen = [random.randrange(-10, 10**12) for _ in range(1000)]
+        zahlen += [2**61 - 1, 2**127 - 1, 997, 1009, 1]
+        self.assertEqual(is_prime_many(zahlen),
+                         [is_prime(n) for n in zahlen])
+        self.assertEqual(is_prime_many(iter(range(10))),
+                         [False, False, True, True, False,
+                          True, False, True, False, False])
+
+    def test_pollard(self):
+        """Tests pollard_rho() and pollard_p_minus_1()."""
+        from kap3 import pollard_rho, pollard_p_minus_1
+        n = 1000003 * 1000033
+        self.assertIn(pollard_rho(n), (1000003, 1000033))
+        # 1000776 = 2^3 * 3 * 7^2 * 23 * 37 ist glatt, 1000000000546 nicht
+        n = 1000777 * 1000000000547
+        self.assertEqual(pollard_p_minus_1(n), 1000777)
+        self.assertEqual(pollard_p_minus_1(n, B=30), 1)
+
+    def test_faktorisierung(self):
+        """Tests faktorisierung() with random and large numbers."""
+        from kap3 import faktorisierung, probediv
+        for _ in range(10):
+            n = random.randrange(10**6)
+            self.assertEqual(faktorisierung(n), probediv(n))
+        for n in range(100):
+            self.assertEqual(faktorisierung(n), probediv(n))
+        p, q = 2**31 - 1, 2**61 - 1
+        self.assertEqual(faktorisierung(p * q), [p, q])
+        self.assertEqual(faktorisierung(q * q * 1009), [1009, q, q])
+        self.assertEqual(faktorisierung(p * q, p_minus_1=False), [p, q])
+
+    def test_prime_pi(self):
+        """Tests prime_pi() against erat() and known values."""
+        from kap3 import erat, prime_pi
+        primes = erat(10000)
+        for _ in range(10):
+            x = random.randrange(-10, 10000)
+            self.assertEqual(prime_pi(x), len([p for p in primes if p <= x]))
+        self.assertEqual(prime_pi(10**6), 78498)
+        self.assertEqual(prime_pi(10**6 + 3), 78499)
+        self.assertEqual(prime_pi(10**8), 5761455)
+        self.assertEqual(prime_pi(10**9), 50847534)
+
+    def test_nth_prime(self):
+        """Tests nth_prime() against erat() and known values."""
+        from kap3 import erat, nth_prime
+        primes = erat(100000)
+        for _ in range(10):
+            n = random.randrange(1, len(primes) + 1)
+            self.assertEqual(nth_prime(n), primes[n - 1])
+        for n in range(1, 20):
+            self.assertEqual(nth_prime(n), primes[n - 1])
+        self.assertEqual(nth_prime(10**6), 15485863)
+        self.assertEqual(nth_prime(10**7), 179424673)
+        self.assertRaises(ValueError, nth_prime, 0)
+
+    def test_multiplikativ_sieb(self):
+        """Tests the multiplicative function sieves by brute force."""
+        from kap3 import eulerphi_sieb, teileranzahl_sieb, teilersumme_sieb
+        from kap3 import moebius_sieb, arithmetische_funktionen, probediv
+        from kap3 import multiplikativ_sieb
+        from math import gcd
+        N = 500
+        phi = [0] + [sum(1 for k in range(1, n + 1) if gcd(k, n) == 1)
+                     for n in range(1, N + 1)]
+        teiler = [[]] + [[d for d in range(1, n + 1) if n % d == 0]
+                         for n in range(1, N + 1)]
+        tau = [len(t) for t in teiler]
+        sigma = [sum(t) for t in teiler]
+        mu = [0, 1]
+        for n in range(2, N + 1):
+            f = probediv(n)
+            mu.append(0 if len(set(f)) < len(f) else (-1)**len(f))
+        self.assertEqual(list(eulerphi_sieb(N)), phi)
+        self.assertEqual(list(teileranzahl_sieb(N)), tau)
+        self.assertEqual(list(teilersumme_sieb(N)), sigma)
+        self.assertEqual(list(moebius_sieb(N)), mu)
+        self.assertEqual([list(f) for f in arithmetische_funktionen(N)],
+                         [phi, tau, sigma, mu])
+        # Liouville-Funktion als benutzerdefinierte Funktion
+        liouville = multiplikativ_sieb(N, lambda p, k: (-1)**k, 'b')
+        for n in range(1, N + 1):
+            self.assertEqual(liouville[n], (-1)**len(probediv(n)))
+        self.assertEqual(list(eulerphi_sieb(1)), [0, 1])
+        self.assertEqual(list(eulerphi_sieb(0)), [0])
@@ -49,6 +49,93 @@ class TestKap4(unittest.TestCase):
             self.assertEqual(ggt(a, b), g)
             self.assertEqual(ggt(b, a), g)
 
+    def test_ggt_binaer(self):
+        """Tests ggt_binaer()."""
+        from kap4 import ggt_binaer as ggt
+        from math import gcd
+        for (a, b, g) in self.ggt_pairs:
+            self.assertEqual(ggt(a, b), g)
+            self.assertEqual(ggt(b, a), g)
+        for _ in range(10):
+            a, b = random.getrandbits(500), random.getrandbits(300)
+            c = random.getrandbits(100)
+            self.assertEqual(ggt(a * c, b * c), gcd(a * c, b * c))
+
+    def test_ggt_lehmer(self):
+        """Tests ggt_lehmer()."""
+        from kap4 import ggt_lehmer as ggt
+        from math import gcd
+        for (a, b, g) in self.ggt_pairs:
+            self.assertEqual(ggt(a, b), g)
+            self.assertEqual(ggt(b, a), g)
+        for _ in range(10):
+            a, b = random.getrandbits(5000), random.getrandbits(3000)
+            c = random.getrandbits(1000)
+            self.assertEqual(ggt(a * c, b * c), gcd(a * c, b * c))
+            self.assertEqual(ggt(a * c, b * c, W=16), gcd(a * c, b * c))
+
+    def test_ggt_auto(self):
+        """Tests ggt_auto()."""
+        from kap4 import ggt_auto as ggt
+        from math import gcd
+        from fractions import Fraction
+        for (a, b, g) in self.ggt_pairs:
+            self.assertEqual(ggt(a, b), g)
+        a, b = random.getrandbits(8000), random.getrandbits(8000)
+        self.assertEqual(ggt(a, b), gcd(a, b))
+        self.assertEqual(ggt(-12, 18), 6)
+        self.assertEqual(ggt(True, 4), 1)
+        self.assertRaises(TypeError, ggt, Fraction(1, 2), 3)
+
+    def test_batch_ggt(self):
+        """Tests batch_ggt() against pairwise gcd computation."""
+        from kap4 import batch_ggt, produktbaum
+        from math import gcd, prod
+        self.assertEqual(produktbaum([2, 3, 5]), [[2, 3, 5], [6, 5], [30]])
+        self.assertEqual(batch_ggt([]), [])
+        self.assertEqual(batch_ggt([15]), [1])
+        for k in (2, 7, 16):
+            zahlen = [random.randrange(1, 10**6) for _ in range(k)]
+            erwartet = [gcd(x, prod(zahlen[:i] + zahlen[i + 1:]))
+                        for i, x in enumerate(zahlen)]
+            self.assertEqual(batch_ggt(zahlen), erwartet)
+        # RSA-Moduln mit gemeinsamem Primfaktor
+        p, q, r, s = 1000003, 1000033, 1000037, 1000039
+        self.assertEqual(batch_ggt([p * q, r * s, p * r]), [p, r, p * r])
+        # Grosse Moduln, sodass die rekursive Division verwendet wird
+        p = random.getrandbits(3000) | 1
+        zahlen = [p * random.getrandbits(3000) for _ in range(3)] + \
+            [random.getrandbits(6000) for _ in range(3)]
+        erwartet = [gcd(x, prod(zahlen[:i] + zahlen[i + 1:]))
+                    for i, x in enumerate(zahlen)]
+        self.assertEqual(batch_ggt(zahlen), erwartet)
+
+    def test_rest(self):
+        """Tests the Burnikel-Ziegler remainder above the threshold."""
+        from kap4.ggt_batch import _rest, _div_grenze
+        for n in (_div_grenze + 1, 2 * _div_grenze + 1, 9000):
+            for _ in range(5):
+                b = random.getrandbits(n) | 1 << (n - 1)
+                a = random.getrandbits(random.randrange(n, 8 * n))
+                self.assertEqual(_rest(a, b), a % b)
+        # Sonderfall in _div3n2n: fuehrende Bloecke von a und b gleich
+        b = (1 << 9000) - 1
+        a = b * ((1 << 9000) - 1) + b - 1
+        self.assertEqual(_rest(a, b), a % b)
+
+    def test_ggt_many(self):
+        """Tests ggt_many() sequentially and with a process pool."""
+        from kap4 import ggt_many
+        from math import gcd
+        from functools import reduce
+        zahlen = [random.randrange(1, 1000) * 360 for _ in range(100)]
+        g = reduce(gcd, zahlen)
+        self.assertEqual(ggt_many(zahlen), g)
+        self.assertEqual(ggt_many(iter(zahlen)), g)
+        self.assertEqual(ggt_many(zahlen, prozesse=2), g)
+        self.assertEqual(ggt_many([]), 0)
+        self.assertEqual(ggt_many([6, 10, 15]), 1)
+
     def test_ggt_rueckwaerts(self):
         """Tests ggt_rueckwaerts()."""
         from kap4 import ggt_rueckwaerts as ggt
@@ -71,6 +158,116 @@ class TestKap4(unittest.TestCase):
             self.assertEqual(g, g_)
             self.assertEqual(m * b + n * a, g)
 
+    def test_ggt_hgcd(self):
+        """Tests ggt_hgcd() against ggt_vorwaerts()."""
+        from kap4 import ggt_hgcd as ggt
+        from kap4 import ggt_vorwaerts
+        for (a, b, g) in self.ggt_pairs:
+            (g_, m, n) = ggt(a, b)
+            self.assertEqual(g, g_)
+            self.assertEqual(m * a + n * b, g)
+            (g_, m, n) = ggt(b, a)
+            self.assertEqual(g, g_)
+            self.assertEqual(m * b + n * a, g)
+        for _ in range(10):
+            a, b = random.getrandbits(12000), random.getrandbits(10000)
+            c = random.getrandbits(3000)
+            self.assertEqual(ggt(a, b), ggt_vorwaerts(a, b))
+            self.assertEqual(ggt(a * c, b * c), ggt_vorwaerts(a * c, b * c))
+
+    def test_ggt_schritte(self):
+        """Tests the step recording of the ggt variants."""
+        import tools
+        from kap4 import (ggt, ggt_wechselwegnahme, ggt_rueckwaerts,
+                          ggt_vorwaerts, ggt_lehmer, ggt_hgcd)
+        # (F_31, F_30) benoetigt 29 Divisionsschritte
+        a, b = 1346269, 832040
+        alt = tools.is_intermediate_values
+        tools.is_intermediate_values = True
+        try:
+            for f in (ggt, ggt_wechselwegnahme, ggt_rueckwaerts,
+                      ggt_vorwaerts, ggt_lehmer, ggt_hgcd):
+                f(a, b)
+                self.assertEqual(len(tools.intermediate_values), 30)
+                self.assertEqual(tools.intermediate_values[0], (a, b))
+        finally:
+            tools.is_intermediate_values = alt
+
+    def test_ggt_harness(self):
+        """Smoke test for benchmarks.ggt_harness.messen()."""
+        import json
+        import math
+        from benchmarks import ggt_harness
+        from kap4 import ggt, ggt_wechselwegnahme
+        verfahren = [('ggt', ggt),
+                     ('ggt_wechselwegnahme', ggt_wechselwegnahme),
+                     ('math.gcd', math.gcd)]
+        ergebnisse = ggt_harness.messen(bitlaengen=[64],
+                                        verfahren=verfahren)
+        self.assertEqual(len(ergebnisse), 3 * len(ggt_harness.faelle))
+        json.dumps(ergebnisse)
+        for e in ergebnisse:
+            if e['verfahren'] == 'math.gcd':
+                self.assertIsNone(e['schritte'])
+            elif e['fall'] == 'schief' and e['verfahren'] != 'ggt':
+                # Zu viele Subtraktionen, wird uebersprungen
+                self.assertIsNone(e['zeit'])
+            else:
+                self.assertGreater(e['schritte'], 0)
+            if e['zeit'] is not None:
+                self.assertGreater(e['zeit'], 0)
+                self.assertGreaterEqual(e['speicher'], 0)
+
+    def test_modinv(self):
+        """Tests modinv() against pow()."""
+        from kap4 import modinv
+        from math import gcd
+        for _ in range(200):
+            m = random.randrange(1, 10**6)
+            a = random.randrange(-10**7, 10**7)
+            if gcd(a, m) == 1:
+                self.assertEqual(modinv(a, m), pow(a, -1, m))
+            else:
+                self.assertRaises(ValueError, modinv, a, m)
+        m = random.getrandbits(5000) | 1
+        self.assertEqual(modinv(2, m), pow(2, -1, m))
+
+    def test_crt(self):
+        """Tests crt() with coprime and non-coprime moduli."""
+        from kap4 import crt
+        self.assertEqual(crt([2, 3, 2], [3, 5, 7]), (23, 105))
+        self.assertEqual(crt([1, 3], [4, 6]), (9, 12))
+        self.assertEqual(crt([], []), (0, 1))
+        self.assertRaises(ValueError, crt, [1, 2], [4, 6])
+        for _ in range(50):
+            moduln = [random.randrange(1, 1000) for _ in range(5)]
+            x = random.randrange(10**15)
+            y, M = crt([x % m for m in moduln], moduln)
+            self.assertEqual(x % M, y)
+
+    def test_crt_baum(self):
+        """Tests crt_baum() against crt()."""
+        from kap4 import crt, crt_baum
+        from kap3 import erat
+        self.assertEqual(crt_baum([2, 3, 2], [3, 5, 7]), (23, 105))
+        self.assertEqual(crt_baum([], []), (0, 1))
+        self.assertEqual(crt_baum([5], [7]), (5, 7))
+        primzahlen = erat(10000)
+        for k in (2, 3, 10, 100, 1000):
+            moduln = random.sample(primzahlen, k)
+            reste = [random.randrange(p) for p in moduln]
+            self.assertEqual(crt_baum(reste, moduln), crt(reste, moduln))
+
+    def test_modinv_batch(self):
+        """Tests modinv_batch() against modinv()."""
+        from kap4 import modinv, modinv_batch
+        p = 1000000007
+        werte = [random.randrange(1, p) for _ in range(500)]
+        self.assertEqual(modinv_batch(werte, p), [modinv(a, p) for a in werte])
+        self.assertEqual(modinv_batch([], p), [])
+        self.assertEqual(modinv_batch([3], 7), [5])
+        self.assertRaises(ValueError, modinv_batch, [3, 2], 4)
+
     def test_regula_falsi(self):
         """Tests regula_falsi()."""
         from kap4 import regula_falsi
@@ -100,7 +297,7 @@ class TestKap4(unittest.TestCase):
 
     def test_zifferndarstellung(self):
         """Tests zifferndarstellung()."""
-        from kap4 import zifferndarstellung
+        from kap4 import zifferndarstellung, periodenlaenge, bruchdarstellung
         from fractions import Fraction
 
         Q, l = zifferndarstellung(Fraction(147181, 999000), 10)
@@ -115,6 +312,66 @@ class TestKap4(unittest.TestCase):
         self.assertEqual(Q, [0, 5, 8, 8, 2, 3, 5, 2, 9, 4, 1, 1, 7, 6, 4, 7])
         self.assertEqual(l, 0)
 
+        # Grosse Nenner: Periode und Vorperiode werden vorab bestimmt
+        for q in (Fraction(1, 99991), Fraction(-12345, 2**7 * 5**3 * 9973),
+                  Fraction(10**6 + 1, 3 * 4096)):
+            Q, l = zifferndarstellung(q, 10)
+            self.assertEqual((l, len(Q) - l), periodenlaenge(q, 10))
+            self.assertEqual(bruchdarstellung(Q, l), q)
+
+    def test_periodenlaenge(self):
+        """Tests periodenlaenge()."""
+        from kap4 import periodenlaenge
+        from fractions import Fraction
+        self.assertEqual(periodenlaenge(Fraction(1, 7)), (0, 6))
+        self.assertEqual(periodenlaenge(Fraction(1, 8)), (3, 1))
+        self.assertEqual(periodenlaenge(Fraction(1, 12)), (2, 1))
+        self.assertEqual(periodenlaenge(Fraction(1, 12), 12), (1, 1))
+        self.assertEqual(periodenlaenge(Fraction(5, 28), 2), (2, 3))
+        self.assertEqual(periodenlaenge(Fraction(1, 999999937)),
+                         (0, 333333312))
+        self.assertEqual(periodenlaenge(Fraction(3)), (0, 1))
+
+    def test_ziffern(self):
+        """Tests ziffern() and periode_brent() against
+        zifferndarstellung()."""
+        from kap4 import ziffern, periode_brent, zifferndarstellung
+        from kap4 import periodenlaenge
+        from fractions import Fraction
+        from itertools import islice
+        for _ in range(50):
+            b = random.randrange(1, 500)
+            q = Fraction(random.randrange(-2 * b, 2 * b), b)
+            p = random.choice([2, 3, 10, 12])
+            Q, k = zifferndarstellung(q, p)
+            self.assertEqual(list(islice(ziffern(q, p), len(Q))), Q)
+            self.assertEqual(periode_brent(q, p), (k, len(Q) - k))
+        for q in (Fraction(1, 9973), Fraction(7, 2**5 * 3 * 104729)):
+            self.assertEqual(periode_brent(q), periodenlaenge(q))
+
+    def test_ziffern_schreiben(self):
+        """Tests ziffern_schreiben() with a buffer and a file."""
+        from kap4 import ziffern_schreiben, zifferndarstellung
+        from fractions import Fraction
+        import io
+        import tempfile
+        for q, p in ((Fraction(147181, 999000), 10), (Fraction(1, 17), 10),
+                     (Fraction(5, 28), 2), (Fraction(1, 97), 16),
+                     (Fraction(0), 10)):
+            Q, k = zifferndarstellung(q, p)
+            puffer = io.StringIO()
+            self.assertEqual(ziffern_schreiben(q, puffer, p, puffer=5),
+                             (k, len(Q) - k))
+            self.assertEqual(puffer.getvalue(),
+                             ''.join('0123456789abcdef'[d] for d in Q))
+        with tempfile.TemporaryFile('w+') as datei:
+            self.assertEqual(ziffern_schreiben(Fraction(1, 7), datei,
+                                               anzahl=1000), 1000)
+            datei.seek(0)
+            self.assertEqual(datei.read(), 166 * '142857' + '1428')
+        self.assertRaises(ValueError, ziffern_schreiben, Fraction(3, 2),
+                          io.StringIO())
+
     def test_dezimaldarstellung(self):
         """Tests dezimaldarstellung()."""
         from kap4 import dezimaldarstellung
@@ -123,6 +380,21 @@ class TestKap4(unittest.TestCase):
         self.assertEqual(Q, [2])
         Q = dezimaldarstellung(Fraction(1, 16))
         self.assertEqual(Q, [0, 6, 2, 5])
+        Q = dezimaldarstellung(Fraction(1, 2**100))
+        self.assertEqual(len(Q), 100)
+        self.assertEqual(Fraction(int(''.join(map(str, Q))), 10**100),
+                         Fraction(1, 2**100))
+        self.assertEqual(dezimaldarstellung(Fraction(3, 2)), [15])
+        self.assertEqual(dezimaldarstellung(Fraction(-1, 4)), [-2, -5])
+        self.assertEqual(dezimaldarstellung(Fraction(0)), [])
+        # Periodische Darstellungen
+        self.assertRaises(ValueError, dezimaldarstellung, Fraction(1, 3))
+        Q = dezimaldarstellung(Fraction(1, 7), max_digits=20)
+        self.assertEqual(Q, 3 * [1, 4, 2, 8, 5, 7] + [1, 4])
+        self.assertEqual(dezimaldarstellung(Fraction(1, 8), max_digits=2),
+                         [1, 2])
+        Q = dezimaldarstellung(Fraction(1, 7), zeitbudget=0.01)
+        self.assertEqual(Q[:6], [1, 4, 2, 8, 5, 7])
 
     def test_summendarstellung(self):
         """Tests summendarstellung()."""
@@ -149,17 +421,247 @@ class TestKap4(unittest.TestCase):
             q = Fraction(*ab)
             self.assertEqual(bruchdarstellung(*zifferndarstellung(q)), q)
 
+    def test_RationaleZahl_kreuzkuerzen(self):
+        """Tests that RationaleZahl results are reduced."""
+        from kap4 import RationaleZahl
+        from fractions import Fraction
+        q, f = RationaleZahl(), Fraction()
+        for _ in range(200):
+            a, b = random.randrange(-30, 30), random.randrange(1, 30)
+            if random.random() < 0.5:
+                q, f = q + RationaleZahl(a, b), f + Fraction(a, b)
+            else:
+                q, f = q - RationaleZahl(a, b) * 7, f - Fraction(a, b) * 7
+            if a != 0:
+                r = RationaleZahl(b, a) / q if q.m else RationaleZahl(1)
+                g = Fraction(b, a) / f if f else Fraction(1)
+                self.assertEqual((r.m, r.n), (g.numerator, g.denominator))
+            self.assertEqual((q.m, q.n), (f.numerator, f.denominator))
+        self.assertFalse(hasattr(q, '__dict__'))
+        self.assertRaises(ZeroDivisionError, q.__truediv__, 0)
+
+    def test_RationaleZahl_ordnung(self):
+        """Tests ordering, hashing and float support of RationaleZahl."""
+        from kap4 import RationaleZahl
+        from fractions import Fraction
+        werte = [(random.randrange(-50, 50), random.randrange(1, 50))
+                 for _ in range(100)]
+        qs = [RationaleZahl(*w) for w in werte]
+        fs = [Fraction(*w) for w in werte]
+        self.assertEqual([q.als_fraction() for q in sorted(qs)], sorted(fs))
+        for q, f in zip(qs, fs):
+            self.assertEqual(hash(q), hash(f))
+            self.assertEqual(q, f)
+            self.assertEqual(f, q)
+            self.assertEqual(float(q), float(f))
+            self.assertEqual(q < 0, f < 0)
+            self.assertEqual(q >= Fraction(1, 3), f >= Fraction(1, 3))
+            self.assertEqual(q > 0.25, f > 0.25)
+            self.assertEqual(q ** 3, f ** 3)
+            if f:
+                self.assertEqual(q ** -2, f ** -2)
+        self.assertEqual(len(set(qs) | set(fs)), len(set(fs)))
+        self.assertEqual(RationaleZahl(6, 3), 2)
+        self.assertEqual(hash(RationaleZahl(6, 3)), hash(2))
+        self.assertNotEqual(RationaleZahl(1, 2), 'a')
+        self.assertLess(RationaleZahl(10**9), float('inf'))
+        self.assertRaises(ZeroDivisionError, RationaleZahl(0).__pow__, -1)
+
+    def test_RationaleZahl_rational(self):
+        """Tests the numbers.Rational protocol of RationaleZahl."""
+        from kap4 import RationaleZahl
+        from fractions import Fraction
+        import math
+        import numbers
+        self.assertIsInstance(RationaleZahl(1, 2), numbers.Rational)
+        for _ in range(100):
+            w = (random.randrange(-50, 50), random.randrange(1, 20))
+            q, f = RationaleZahl(*w), Fraction(*w)
+            self.assertEqual(bool(q), bool(f))
+            self.assertEqual(q.real, f.real)
+            self.assertIsInstance(q.real, RationaleZahl)
+            self.assertEqual(q.imag, 0)
+            self.assertEqual(q.conjugate(), f.conjugate())
+            self.assertEqual(complex(q), complex(f))
+            for g in (int, math.trunc, math.floor, math.ceil, round):
+                self.assertEqual(g(q), g(f))
+            for k in (-1, 1, 2):
+                self.assertEqual(round(q, k), round(f, k))
+            d = random.choice([-1, 1]) * random.randrange(1, 20)
+            for other in (d, Fraction(d, 7), RationaleZahl(d, 7)):
+                self.assertEqual(q // other, f // other)
+                self.assertEqual(q % other, f % other)
+                self.assertEqual(divmod(q, other), divmod(f, other))
+                if f:
+                    self.assertEqual(other // q, other // f)
+                    self.assertEqual(other % q, other % f)
+            self.assertEqual(q % 2.5, f % 2.5)
+        self.assertRaises(ZeroDivisionError, RationaleZahl(1).__mod__, 0)
+        for basis in (2, -3, Fraction(2, 3), RationaleZahl(2, 3)):
+            for k in (-2, 0, 3):
+                p = basis ** RationaleZahl(k)
+                self.assertEqual(p, basis ** Fraction(k))
+                self.assertNotIsInstance(p, float)
+        self.assertEqual(2.0 ** RationaleZahl(-1), 0.5)
+        self.assertEqual(4 ** RationaleZahl(1, 2), 2.0)
+        self.assertEqual(RationaleZahl(4) ** Fraction(2), 16)
+        self.assertRaises(TypeError, pow, RationaleZahl(2), 'a')
+        self.assertRaises(TypeError, pow, 'a', RationaleZahl(2))
+
+    def test_RationaleZahl_umwandlung(self):
+        """Tests conversion of RationaleZahl from float and Fraction."""
+        from kap4 import RationaleZahl
+        from fractions import Fraction
+        for _ in range(100):
+            x = random.uniform(-1e6, 1e6)
+            q = RationaleZahl.aus_float(x)
+            self.assertEqual(q.als_fraction(), Fraction(x))
+            self.assertEqual(float(q), x)
+            f = Fraction(random.randrange(-99, 99), random.randrange(1, 99))
+            q = RationaleZahl.aus_fraction(f)
+            self.assertEqual((q.m, q.n), (f.numerator, f.denominator))
+            self.assertEqual(q.als_fraction(), f)
+            self.assertEqual(hash(q.als_fraction()), hash(f))
+            self.assertEqual(q + f, 2 * f)
+            self.assertEqual(f + q, 2 * f)
+        self.assertEqual(RationaleZahl(1, 2) + 0.25, RationaleZahl(3, 4))
+        # Der Konstruktor rundet Gleitkommazahlen und Brueche nicht
+        self.assertEqual(RationaleZahl(0.5), Fraction(1, 2))
+        self.assertEqual(RationaleZahl(Fraction(1, 2)), Fraction(1, 2))
+        self.assertEqual(RationaleZahl(1, 0.5), 2)
+        self.assertEqual(RationaleZahl(Fraction(3, 4), -0.5), Fraction(-3, 2))
+        self.assertEqual(RationaleZahl(RationaleZahl(1, 3), 2),
+                         Fraction(1, 6))
+        self.assertRaises(TypeError, RationaleZahl, '1')
+
+    def test_RationaleZahl_unveraenderlich(self):
+        """Tests that numerator and denominator cannot be changed."""
+        from kap4 import RationaleZahl
+        q = RationaleZahl(1, 2)
+        menge = {q}
+        with self.assertRaises(AttributeError):
+            q.m = 4
+        with self.assertRaises(AttributeError):
+            q.n = 3
+        self.assertEqual((q.m, q.n), (1, 2))
+        self.assertIn(RationaleZahl(2, 4), menge)
+
+    def test_RationaleZahl_verzoegert(self):
+        """Tests RationaleZahl with deferred reduction."""
+        from kap4 import RationaleZahl
+        from fractions import Fraction
+        with RationaleZahl.verzoegert(64):
+            q, f = RationaleZahl(), Fraction()
+            for k in range(1, 300):
+                q, f = q + RationaleZahl(1, k), f + Fraction(1, k)
+                q, f = q * RationaleZahl(k, k + 1), f * Fraction(k, k + 1)
+                q, f = q - 1, f - 1
+                q, f = q / RationaleZahl(-3, k), f / Fraction(-3, k)
+            self.assertEqual(q < 1, f < 1)
+            self.assertEqual(hash(q), hash(f))
+            self.assertEqual(str(q), str(f))
+            self.assertEqual((q.m, q.n), (f.numerator, f.denominator))
+        self.assertIsNone(RationaleZahl.kuerzen_ab)
+        with RationaleZahl.verzoegert():
+            q = RationaleZahl(1, 2) * 4
+        self.assertEqual(q + RationaleZahl(1, 3), RationaleZahl(7, 3))
+        self.assertEqual(q ** 2, 4)
+
+    def test_RationaleMatrix(self):
+        """Tests RationaleMatrix against Fraction arithmetic."""
+        from kap4 import RationaleMatrix, RationaleZahl
+        from fractions import Fraction
+        for _ in range(20):
+            n = random.randrange(1, 8)
+            A = [[Fraction(random.randrange(-9, 10), random.randrange(1, 5))
+                  for _ in range(n)] for _ in range(n)]
+            M = RationaleMatrix(A)
+            b = [Fraction(random.randrange(-9, 10), random.randrange(1, 5))
+                 for _ in range(n)]
+            d = M.determinante()
+            if d == 0:
+                self.assertLess(M.rang(), n)
+                self.assertRaises(ValueError, M.loese, b)
+                continue
+            self.assertEqual(M.rang(), n)
+            x = M.loese(b)
+            self.assertIsInstance(x[0], RationaleZahl)
+            for i in range(n):
+                self.assertEqual(sum(A[i][j] * x[j] for j in range(n)), b[i])
+            B = M.inverse()
+            for i in range(n):
+                for j in range(n):
+                    self.assertEqual(sum(A[i][k] * B[k, j]
+                                         for k in range(n)), int(i == j))
+            self.assertEqual(d * B.determinante(), 1)
+        M = RationaleMatrix([[1, 2, 3], [2, 4, 6],
+                             [1, 0, RationaleZahl(1, 2)]])
+        self.assertEqual(M.determinante(), 0)
+        self.assertEqual(M.rang(), 2)
+        self.assertEqual(RationaleMatrix([[0, 1], [1, 0]]).determinante(), -1)
+        self.assertEqual(RationaleMatrix([[0.5, 0], [0, 4]]).inverse()
+                         .als_liste(), [[2, 0], [0, RationaleZahl(1, 4)]])
+        self.assertEqual(RationaleMatrix([[1, 2, 3], [2, 4, 7]]).rang(), 2)
+        self.assertRaises(ValueError, RationaleMatrix([[1, 2]]).determinante)
+
+    def test_rational_sum(self):
+        """Tests rational_sum() against sum()."""
+        from kap4 import rational_sum, RationaleZahl
+        from fractions import Fraction
+        for n in (0, 1, 2, 7, 100):
+            werte = [Fraction(random.randrange(-99, 99),
+                              random.randrange(1, 99)) for _ in range(n)]
+            s = rational_sum(werte)
+            self.assertIsInstance(s, Fraction)
+            self.assertEqual(s, sum(werte, Fraction()))
+            s = rational_sum(RationaleZahl.aus_fraction(f) for f in werte)
+            self.assertIsInstance(s, RationaleZahl if n else Fraction)
+            self.assertEqual(s, sum(werte, Fraction()))
+        self.assertEqual(rational_sum([]), Fraction(0))
+        s = rational_sum([], RationaleZahl(0))
+        self.assertIsInstance(s, RationaleZahl)
+        self.assertEqual(s, 0)
+        self.assertEqual(rational_sum([Fraction(1, 2)], RationaleZahl(1, 3)),
+                         RationaleZahl(5, 6))
+        self.assertEqual(rational_sum([1, 0.5, Fraction(1, 4)]),
+                         Fraction(7, 4))
+        self.assertEqual(rational_sum([RationaleZahl(1, 2), Fraction(1, 3)]),
+                         RationaleZahl(5, 6))
+
+    def test_rational_prod(self):
+        """Tests rational_prod() against math.prod()."""
+        from kap4 import rational_prod, RationaleZahl
+        from fractions import Fraction
+        from math import prod
+        for n in (0, 1, 2, 7, 100):
+            werte = [Fraction(random.randrange(-9, 9) or 1,
+                              random.randrange(1, 9)) for _ in range(n)]
+            self.assertEqual(rational_prod(werte), prod(werte))
+        self.assertEqual(rational_prod(Fraction(k, k + 1)
+                                       for k in range(1, 100)),
+                         Fraction(1, 100))
+        q = rational_prod([RationaleZahl(-2, 3), 0.75])
+        self.assertIsInstance(q, RationaleZahl)
+        self.assertEqual(q, RationaleZahl(-1, 2))
+        self.assertEqual(rational_prod([]), Fraction(1))
+        q = rational_prod([], RationaleZahl(1))
+        self.assertIsInstance(q, RationaleZahl)
+        self.assertEqual(q, 1)
+        self.assertEqual(rational_prod([3], Fraction(1, 6)), Fraction(1, 2))
+
     def test_RationaleZahl(self):
         """Tests datatype RationaleZahl."""
         from kap4 import RationaleZahl
-        from fractions import Fraction, gcd
+        from fractions import Fraction
+        from math import gcd
 
         def frac2Rat(q):
             return RationaleZahl(q.numerator, q.denominator)
 
         for _ in range(10):
             ab1 = (random.randrange(-20, 20), random.randrange(1, 20))
-            ab2 = (random.randrange(-20, 20), random.randrange(1, 20))
+            ab2 = (random.choice([-1, 1]) * random.randrange(1, 20),
+                   random.randrange(1, 20))
             d1 = gcd(*ab1)
             AB1 = (ab1[0] // d1, ab1[1] // d1)
             f1, f2 = Fraction(*ab1), Fraction(*ab2)